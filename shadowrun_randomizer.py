@@ -11,7 +11,8 @@ import struct
 import sys
 import textwrap
 
-from collections import defaultdict, deque
+from array import array
+from collections import defaultdict
 from enum import Enum, Flag, auto
 
 
@@ -364,6 +365,18 @@ Progress = Enum(
     ],
 )
 
+# Give each progress item its own bit, so a set of progress items can be
+# stored as a single integer and subset tests become one AND and compare.
+progressBits = {p: 1 << i for i, p in enumerate(Progress)}
+
+def progressMask(progressItems):
+    mask = 0
+    for p in progressItems:
+        mask |= progressBits[p]
+    return mask
+
+allProgressMask = progressMask(Progress)
+
 class Category(Flag):
     CONSTANT = auto()
     PHYSICAL = auto()
@@ -381,6 +394,12 @@ class Category(Flag):
     PHYSICAL_ITEM = PHYSICAL | ITEM
 
 class Entity:
+    __slots__ = (
+        "category", "description", "entityAddress", "progression",
+        # Precomputed after all of the regions have been created
+        "categoryValue", "progressionMasks",
+    )
+
     def __init__(self, category, description, entityAddress, progression):
         self.category = category
         self.description = description
@@ -388,6 +407,12 @@ class Entity:
         self.progression = progression
 
 class Location:
+    __slots__ = (
+        "region", "category", "description", "vanilla", "requires", "address", "hidden", "current",
+        # Precomputed after all of the regions have been created
+        "categoryValue", "requiresMask",
+    )
+
     def __init__(self, region, category, description, vanilla, requires, address, hidden):
         self.region = region
         self.category = category
@@ -399,11 +424,15 @@ class Location:
         self.current = vanilla
 
 class Door:
+    __slots__ = ("destination", "requires")
+
     def __init__(self, destination, requires):
         self.destination = destination
         self.requires = requires
 
 class Region:
+    __slots__ = ("name", "locations", "doors")
+
     def __init__(self, name):
         self.name = name
         self.locations = []
@@ -4921,46 +4950,235 @@ regions[regionName] = thisRegion
 # GENERATE A WINNABLE SEED
 ########################################################################
 
-def reachableSearch(inventory):
-    root = regions["Root"]
-    reachable = [root]
-    frontier = deque()
-    frontier.append(root)
-    while frontier:
-        region = frontier.popleft()
-        for door in region.doors:
-            if all(r in inventory for r in door.requires):
-                destinationRegion = regions[door.destination]
-                if destinationRegion not in reachable:
-                    reachable.append(destinationRegion)
-                    frontier.append(destinationRegion)
-    return reachable
+# Many doors and locations have identical requirements, so intern them:
+# each distinct set of requirements becomes a single shared frozenset,
+# and its mask is only computed once.
+internedRequires = {}
+internedMasks = {}
+
+def internRequires(requires):
+    requires = frozenset(requires)
+    return internedRequires.setdefault(requires, requires)
+
+def internedMask(requires):
+    mask = internedMasks.get(requires)
+    if mask is None:
+        mask = internedMasks[requires] = progressMask(requires)
+    return mask
+
+# The region graph is complete, so freeze it.
+# Only the "current" entity at each location changes from here on.
+for region in regions.values():
+    region.locations = tuple(region.locations)
+    region.doors = tuple(region.doors)
+    for door in region.doors:
+        door.requires = internRequires(door.requires)
+    for location in region.locations:
+        location.requires = internRequires(location.requires)
+        location.vanilla.progression = tuple(
+            (prize, internRequires(requires))
+            for prize, requires in location.vanilla.progression
+        )
+
+# Flatten the region graph into arrays indexed by integer region-ids.
+# The doors leading out of region N are the entries from doorOffsets[N]
+# up to (but not including) doorOffsets[N+1] in the door arrays.
+# Within that range, the doors with no requirements come first, and the
+# gated doors start at gatedDoorOffsets[N].
+# listedDoorIDs[N] keeps the IDs of region N's doors in the order they
+# were originally listed.
+# Region names and Door objects are only used while building the graph;
+# the searches below work entirely with these arrays.
+regionList = list(regions.values())
+regionIDs = {region.name: regionID for regionID, region in enumerate(regionList)}
+rootID = regionIDs["Root"]
+doorOffsets = array("i", [0])
+gatedDoorOffsets = array("i")
+doorSources = array("i")
+doorDestinations = array("i")
+doorRequires = []
+listedDoorIDs = []
+# Also index the doors by the bits of the progress items they require, so
+# the search can revisit only the doors that a newly-acquired item might
+# have opened.
+doorsByProgressBit = defaultdict(list)
+for regionID, region in enumerate(regionList):
+    freeDoors = [door for door in region.doors if not door.requires]
+    gatedDoors = [door for door in region.doors if door.requires]
+    gatedDoorOffsets.append(doorOffsets[-1] + len(freeDoors))
+    orderedDoors = freeDoors + gatedDoors
+    listedDoorIDs.append(tuple(doorOffsets[-1] + orderedDoors.index(door) for door in region.doors))
+    for door in orderedDoors:
+        for r in door.requires:
+            doorsByProgressBit[progressBits[r]].append(len(doorDestinations))
+        doorSources.append(regionID)
+        doorDestinations.append(regionIDs[door.destination])
+        doorRequires.append(internedMask(door.requires))
+    doorOffsets.append(len(doorDestinations))
+
+# Precompute the requirement masks for locations and entities.
+# Progression is compiled per entity rather than per location, since the
+# entity at each location changes with every candidate seed.
+# Also store the categories as plain integers, since testing Flag members
+# with "&" is slow enough to show up in the placement loop.
+keyItemValue = Category.KEY_ITEM.value
+physicalValue = Category.PHYSICAL.value
+for region in regionList:
+    for location in region.locations:
+        location.categoryValue = location.category.value
+        location.vanilla.categoryValue = location.vanilla.category.value
+        location.requiresMask = internedMask(location.requires)
+        location.vanilla.progressionMasks = [
+            (prize, progressBits[prize], internedMask(requires))
+            for prize, requires in location.vanilla.progression
+        ]
+
+# Regions are only ever added to the end of the reachable array, so it
+# doubles as the search queue: reachable[start:] are the regions whose
+# doors haven't been checked yet.
+# This function and sphereSearch run for every candidate seed, so they
+# bind the globals and methods they use to local names up front.
+def reachableSearch(inventoryMask, reachable, visited, start):
+    offsets = doorOffsets
+    gatedOffsets = gatedDoorOffsets
+    destinations = doorDestinations
+    requiresMasks = doorRequires
+    appendRegion = reachable.append
+    head = start
+    while head < len(reachable):
+        regionID = reachable[head]
+        head += 1
+        gatedOffset = gatedOffsets[regionID]
+        for doorID in range(offsets[regionID], gatedOffset):
+            destinationID = destinations[doorID]
+            if not visited[destinationID]:
+                visited[destinationID] = 1
+                appendRegion(destinationID)
+        for doorID in range(gatedOffset, offsets[regionID + 1]):
+            destinationID = destinations[doorID]
+            if not visited[destinationID]:
+                requiresMask = requiresMasks[doorID]
+                if (requiresMask & inventoryMask) == requiresMask:
+                    visited[destinationID] = 1
+                    appendRegion(destinationID)
 
 def sphereSearch():
-    spheres = []
-    inventory = []
-    reachable = reachableSearch(inventory)
+    inventoryMask = 0
+    visited = bytearray(len(regionList))
+    visited[rootID] = 1
+    reachable = array("i", [rootID])
+    reachableSearch(inventoryMask, reachable, visited, 0)
+    sources = doorSources
+    destinations = doorDestinations
+    requiresMasks = doorRequires
+    appendRegion = reachable.append
+
+    # For each region, the locations that still have uncollected prizes,
+    # along with their uncollected progression entries.
+    # Collected entries are removed, and locations with nothing left to
+    # collect are dropped, so later spheres don't keep rescanning them.
+    activeLocations = [
+        [
+            (location, list(location.current.progressionMasks))
+            for location in region.locations
+            if location.current.progressionMasks
+        ]
+        for region in regionList
+    ]
 
+    while True:
+        newInventoryBits = []
+        newInventoryMask = 0
+        appendInventoryBit = newInventoryBits.append
+        for regionID in reachable:
+            locationsDone = False
+            for location, pending in activeLocations[regionID]:
+                locationMask = location.requiresMask
+                if (locationMask & inventoryMask) == locationMask:
+                    stale = False
+                    for prize, prizeBit, requiresMask in pending:
+                        if prizeBit & (inventoryMask | newInventoryMask):
+                            # Already collected, either in an earlier sphere
+                            # or by another location in this one.
+                            stale = True
+                        elif (requiresMask & inventoryMask) == requiresMask:
+                            appendInventoryBit(prizeBit)
+                            newInventoryMask |= prizeBit
+                            stale = True
+                    if stale:
+                        collectedMask = inventoryMask | newInventoryMask
+                        pending[:] = [entry for entry in pending if not (entry[1] & collectedMask)]
+                        if not pending:
+                            locationsDone = True
+            if locationsDone:
+                activeLocations[regionID] = [entry for entry in activeLocations[regionID] if entry[1]]
+
+        if not newInventoryMask:
+            break
+
+        inventoryMask |= newInventoryMask
+
+        # Regions stay reachable once reached, so only the doors gated by
+        # the new items need checking. Resume the search from whichever
+        # regions those doors have just opened up.
+        searched = len(reachable)
+        for prizeBit in newInventoryBits:
+            for doorID in doorsByProgressBit.get(prizeBit, ()):
+                destinationID = destinations[doorID]
+                if visited[sources[doorID]] and not visited[destinationID]:
+                    requiresMask = requiresMasks[doorID]
+                    if (requiresMask & inventoryMask) == requiresMask:
+                        visited[destinationID] = 1
+                        appendRegion(destinationID)
+        reachableSearch(inventoryMask, reachable, visited, searched)
+
+    return inventoryMask
+
+# The searches above don't visit the regions in any particular order,
+# which is fine for checking whether a seed is winnable. The spoiler log
+# lists each sphere in breadth-first order from the root, following each
+# region's doors in the order they were listed, and credits a prize to
+# the first location in that order that awards it.
+def regionOrder(inventoryMask):
+    destinations = doorDestinations
+    requiresMasks = doorRequires
+    visited = bytearray(len(regionList))
+    visited[rootID] = 1
+    order = [rootID]
+    for regionID in order:
+        for doorID in listedDoorIDs[regionID]:
+            destinationID = destinations[doorID]
+            if not visited[destinationID]:
+                requiresMask = requiresMasks[doorID]
+                if (requiresMask & inventoryMask) == requiresMask:
+                    visited[destinationID] = 1
+                    order.append(destinationID)
+    return order
+
+# Rebuild the spheres for the spoiler log. This only runs once, for the
+# winning seed.
+def spoilerSpheres():
+    spheres = []
+    inventoryMask = 0
     while True:
         newSphere = []
-        newInventory = []
-        for region in reachable:
-            for location in region.locations:
-                if all(r in inventory for r in location.requires):
-                    for prize, requires in location.current.progression:
-                        if prize not in inventory and prize not in newInventory:
-                            if all(r in inventory for r in requires):
-                                newSphere.append((location, prize))
-                                newInventory.append(prize)
-
-        if not newInventory:
+        newInventoryMask = 0
+        for regionID in regionOrder(inventoryMask):
+            for location in regionList[regionID].locations:
+                locationMask = location.requiresMask
+                if (locationMask & inventoryMask) == locationMask:
+                    for prize, prizeBit, requiresMask in location.current.progressionMasks:
+                        if not (prizeBit & (inventoryMask | newInventoryMask)) and (requiresMask & inventoryMask) == requiresMask:
+                            newSphere.append((location, prize))
+                            newInventoryMask |= prizeBit
+
+        if not newInventoryMask:
             break
 
         spheres.append(newSphere)
-        inventory.extend(newInventory)
-        reachable = reachableSearch(inventory)
+        inventoryMask |= newInventoryMask
 
-    return spheres, inventory
+    return spheres
 
 #debugLocations = defaultdict(list)
 #debugEntities = defaultdict(list)
@@ -4975,156 +5193,124 @@ def sphereSearch():
 #for category, entityList in debugEntities.items():
 #    print(f"DEBUG ---- {category} = {len(entityList)}")
 
+# Helper function for placing the entities in a category.
+# remainingLocations and remainingEntities map each category's integer
+# value to the locations and entities in it that are still unplaced.
+# The category's locations and entities are shuffled, and pairs are
+# taken from the ends of the two lists and removed from them.
+# Any unpaired locations or entities are left behind, or moved to the
+# leftover category (if there is one) to be placed along with it.
+def placeCategory(remainingLocations, remainingEntities, category, leftoverCategory=None):
+    locations = remainingLocations[category]
+    entities = remainingEntities[category]
+    rng.shuffle(locations)
+    rng.shuffle(entities)
+    count = min(len(locations), len(entities))
+    for location, entity in zip(reversed(locations), reversed(entities)):
+        location.current = entity
+    del locations[len(locations) - count:]
+    del entities[len(entities) - count:]
+    if leftoverCategory is not None:
+        remainingLocations[leftoverCategory].extend(locations)
+        locations.clear()
+        remainingEntities[leftoverCategory].extend(entities)
+        entities.clear()
+
+# Categorize the locations and entities.
+# This doesn't depend on the candidate seed, so it's done once up front,
+# and each attempt works on its own copies of the lists.
+# The lists are keyed by the categories' integer values rather than by
+# the Category members, since hashing an Enum member runs Python code.
+earlyWeaponValue = Category.EARLY_WEAPON.value
+weaponValue = Category.WEAPON.value
+earlyArmorValue = Category.EARLY_ARMOR.value
+armorValue = Category.ARMOR.value
+weaponOrArmorValue = Category.WEAPON_OR_ARMOR.value
+talismanValue = Category.TALISMAN.value
+physicalItemValue = Category.PHYSICAL_ITEM.value
+itemValue = Category.ITEM.value
+npcValue = Category.NPC.value
+categorizedLocations = defaultdict(list)
+categorizedEntities = defaultdict(list)
+for region in regions.values():
+    for location in region.locations:
+        if location.categoryValue & keyItemValue:
+            categorizedLocations[keyItemValue].append(location)
+        else:
+            categorizedLocations[location.categoryValue].append(location)
+        if location.vanilla.categoryValue & keyItemValue:
+            categorizedEntities[keyItemValue].append(location.vanilla)
+        else:
+            categorizedEntities[location.vanilla.categoryValue].append(location.vanilla)
+
 # Generate a winnable seed.
 print("Generating...")
 attemptNumber = 1
 while True:
     # Generate a candidate seed.
-
-    # Categorize the locations and entities.
     remainingLocations = defaultdict(list)
     remainingEntities = defaultdict(list)
-    for region in regions.values():
-        for location in region.locations:
-            if location.category & Category.KEY_ITEM:
-                remainingLocations[Category.KEY_ITEM].append(location)
-            else:
-                remainingLocations[location.category].append(location)
-            if location.vanilla.category & Category.KEY_ITEM:
-                remainingEntities[Category.KEY_ITEM].append(location.vanilla)
-            else:
-                remainingEntities[location.vanilla.category].append(location.vanilla)
+    for category, locationList in categorizedLocations.items():
+        remainingLocations[category] = locationList.copy()
+    for category, entityList in categorizedEntities.items():
+        remainingEntities[category] = entityList.copy()
 
     # Key items
-    rng.shuffle(remainingLocations[Category.KEY_ITEM])
-    rng.shuffle(remainingEntities[Category.KEY_ITEM])
-    while remainingLocations[Category.KEY_ITEM] and remainingEntities[Category.KEY_ITEM]:
-        poppedLocation = remainingLocations[Category.KEY_ITEM].pop()
-        poppedEntity = remainingEntities[Category.KEY_ITEM].pop()
-        poppedLocation.current = poppedEntity
-    while remainingLocations[Category.KEY_ITEM]:
-        poppedLocation = remainingLocations[Category.KEY_ITEM].pop()
-        if poppedLocation.category & Category.PHYSICAL:
-            remainingLocations[Category.PHYSICAL_ITEM].append(poppedLocation)
+    placeCategory(remainingLocations, remainingEntities, keyItemValue)
+    while remainingLocations[keyItemValue]:
+        poppedLocation = remainingLocations[keyItemValue].pop()
+        if poppedLocation.categoryValue & physicalValue:
+            remainingLocations[physicalItemValue].append(poppedLocation)
         else:
-            remainingLocations[Category.ITEM].append(poppedLocation)
-    while remainingEntities[Category.KEY_ITEM]:
-        poppedEntity = remainingEntities[Category.KEY_ITEM].pop()
-        if poppedEntity.category & Category.PHYSICAL:
-            remainingEntities[Category.PHYSICAL_ITEM].append(poppedEntity)
+            remainingLocations[itemValue].append(poppedLocation)
+    while remainingEntities[keyItemValue]:
+        poppedEntity = remainingEntities[keyItemValue].pop()
+        if poppedEntity.categoryValue & physicalValue:
+            remainingEntities[physicalItemValue].append(poppedEntity)
         else:
-            remainingEntities[Category.ITEM].append(poppedEntity)
+            remainingEntities[itemValue].append(poppedEntity)
 
     # Early weapons
-    rng.shuffle(remainingLocations[Category.EARLY_WEAPON])
-    rng.shuffle(remainingEntities[Category.EARLY_WEAPON])
-    while remainingLocations[Category.EARLY_WEAPON] and remainingEntities[Category.EARLY_WEAPON]:
-        poppedLocation = remainingLocations[Category.EARLY_WEAPON].pop()
-        poppedEntity = remainingEntities[Category.EARLY_WEAPON].pop()
-        poppedLocation.current = poppedEntity
-    remainingLocations[Category.WEAPON].extend(remainingLocations[Category.EARLY_WEAPON])
-    remainingLocations[Category.EARLY_WEAPON].clear()
-    remainingEntities[Category.WEAPON].extend(remainingEntities[Category.EARLY_WEAPON])
-    remainingEntities[Category.EARLY_WEAPON].clear()
+    placeCategory(remainingLocations, remainingEntities, earlyWeaponValue, weaponValue)
 
     # Weapons
-    rng.shuffle(remainingLocations[Category.WEAPON])
-    rng.shuffle(remainingEntities[Category.WEAPON])
-    while remainingLocations[Category.WEAPON] and remainingEntities[Category.WEAPON]:
-        poppedLocation = remainingLocations[Category.WEAPON].pop()
-        poppedEntity = remainingEntities[Category.WEAPON].pop()
-        poppedLocation.current = poppedEntity
-    remainingLocations[Category.WEAPON_OR_ARMOR].extend(remainingLocations[Category.WEAPON])
-    remainingLocations[Category.WEAPON].clear()
-    remainingEntities[Category.WEAPON_OR_ARMOR].extend(remainingEntities[Category.WEAPON])
-    remainingEntities[Category.WEAPON].clear()
+    placeCategory(remainingLocations, remainingEntities, weaponValue, weaponOrArmorValue)
 
     # Early armor
-    rng.shuffle(remainingLocations[Category.EARLY_ARMOR])
-    rng.shuffle(remainingEntities[Category.EARLY_ARMOR])
-    while remainingLocations[Category.EARLY_ARMOR] and remainingEntities[Category.EARLY_ARMOR]:
-        poppedLocation = remainingLocations[Category.EARLY_ARMOR].pop()
-        poppedEntity = remainingEntities[Category.EARLY_ARMOR].pop()
-        poppedLocation.current = poppedEntity
-    remainingLocations[Category.ARMOR].extend(remainingLocations[Category.EARLY_ARMOR])
-    remainingLocations[Category.EARLY_ARMOR].clear()
-    remainingEntities[Category.ARMOR].extend(remainingEntities[Category.EARLY_ARMOR])
-    remainingEntities[Category.EARLY_ARMOR].clear()
+    placeCategory(remainingLocations, remainingEntities, earlyArmorValue, armorValue)
 
     # Armor
-    rng.shuffle(remainingLocations[Category.ARMOR])
-    rng.shuffle(remainingEntities[Category.ARMOR])
-    while remainingLocations[Category.ARMOR] and remainingEntities[Category.ARMOR]:
-        poppedLocation = remainingLocations[Category.ARMOR].pop()
-        poppedEntity = remainingEntities[Category.ARMOR].pop()
-        poppedLocation.current = poppedEntity
-    remainingLocations[Category.WEAPON_OR_ARMOR].extend(remainingLocations[Category.ARMOR])
-    remainingLocations[Category.ARMOR].clear()
-    remainingEntities[Category.WEAPON_OR_ARMOR].extend(remainingEntities[Category.ARMOR])
-    remainingEntities[Category.ARMOR].clear()
+    placeCategory(remainingLocations, remainingEntities, armorValue, weaponOrArmorValue)
 
     # Weapons or armor
-    rng.shuffle(remainingLocations[Category.WEAPON_OR_ARMOR])
-    rng.shuffle(remainingEntities[Category.WEAPON_OR_ARMOR])
-    while remainingLocations[Category.WEAPON_OR_ARMOR] and remainingEntities[Category.WEAPON_OR_ARMOR]:
-        poppedLocation = remainingLocations[Category.WEAPON_OR_ARMOR].pop()
-        poppedEntity = remainingEntities[Category.WEAPON_OR_ARMOR].pop()
-        poppedLocation.current = poppedEntity
-    remainingLocations[Category.ITEM].extend(remainingLocations[Category.WEAPON_OR_ARMOR])
-    remainingLocations[Category.WEAPON_OR_ARMOR].clear()
-    remainingEntities[Category.ITEM].extend(remainingEntities[Category.WEAPON_OR_ARMOR])
-    remainingEntities[Category.WEAPON_OR_ARMOR].clear()
+    placeCategory(remainingLocations, remainingEntities, weaponOrArmorValue, itemValue)
 
     # Talismans
-    rng.shuffle(remainingLocations[Category.TALISMAN])
-    rng.shuffle(remainingEntities[Category.TALISMAN])
-    while remainingLocations[Category.TALISMAN] and remainingEntities[Category.TALISMAN]:
-        poppedLocation = remainingLocations[Category.TALISMAN].pop()
-        poppedEntity = remainingEntities[Category.TALISMAN].pop()
-        poppedLocation.current = poppedEntity
-    remainingLocations[Category.ITEM].extend(remainingLocations[Category.TALISMAN])
-    remainingLocations[Category.TALISMAN].clear()
-    remainingEntities[Category.ITEM].extend(remainingEntities[Category.TALISMAN])
-    remainingEntities[Category.TALISMAN].clear()
+    placeCategory(remainingLocations, remainingEntities, talismanValue, itemValue)
 
     # Physical items
-    rng.shuffle(remainingLocations[Category.PHYSICAL_ITEM])
-    rng.shuffle(remainingEntities[Category.PHYSICAL_ITEM])
-    while remainingLocations[Category.PHYSICAL_ITEM] and remainingEntities[Category.PHYSICAL_ITEM]:
-        poppedLocation = remainingLocations[Category.PHYSICAL_ITEM].pop()
-        poppedEntity = remainingEntities[Category.PHYSICAL_ITEM].pop()
-        poppedLocation.current = poppedEntity
+    placeCategory(remainingLocations, remainingEntities, physicalItemValue)
     # Remaining "physical item" locations become "generic item" locations
-    remainingLocations[Category.ITEM].extend(remainingLocations[Category.PHYSICAL_ITEM])
-    remainingLocations[Category.PHYSICAL_ITEM].clear()
+    remainingLocations[itemValue].extend(remainingLocations[physicalItemValue])
+    remainingLocations[physicalItemValue].clear()
     # Remaining "physical item" entities should not happen
-    if remainingEntities[Category.PHYSICAL_ITEM]:
+    if remainingEntities[physicalItemValue]:
         raise Exception("Could not place a 'Category.PHYSICAL_ITEM' entity")
 
     # Generic items
-    rng.shuffle(remainingLocations[Category.ITEM])
-    rng.shuffle(remainingEntities[Category.ITEM])
-    while remainingLocations[Category.ITEM] and remainingEntities[Category.ITEM]:
-        poppedLocation = remainingLocations[Category.ITEM].pop()
-        poppedEntity = remainingEntities[Category.ITEM].pop()
-        poppedLocation.current = poppedEntity
+    placeCategory(remainingLocations, remainingEntities, itemValue)
     # Remaining "generic item" locations and entities should not happen
-    if remainingLocations[Category.ITEM]:
+    if remainingLocations[itemValue]:
         raise Exception("Could not fill a 'Category.ITEM' location")
-    if remainingEntities[Category.ITEM]:
+    if remainingEntities[itemValue]:
         raise Exception("Could not place a 'Category.ITEM' entity")
 
     # NPCs
-    rng.shuffle(remainingLocations[Category.NPC])
-    rng.shuffle(remainingEntities[Category.NPC])
-    while remainingLocations[Category.NPC] and remainingEntities[Category.NPC]:
-        poppedLocation = remainingLocations[Category.NPC].pop()
-        poppedEntity = remainingEntities[Category.NPC].pop()
-        poppedLocation.current = poppedEntity
+    placeCategory(remainingLocations, remainingEntities, npcValue)
     # Remaining "NPC" locations and entities should not happen
-    if remainingLocations[Category.NPC]:
+    if remainingLocations[npcValue]:
         raise Exception("Could not fill a 'Category.NPC' location")
-    if remainingEntities[Category.NPC]:
+    if remainingEntities[npcValue]:
         raise Exception("Could not place a 'Category.NPC' entity")
 
     # Check if the candidate seed is winnable.
@@ -5132,8 +5318,8 @@ while True:
     # sphere search is technically winnable, but that doesn't guarantee
     # that everything will be reachable. So instead, we consider a seed
     # winnable only if 100% completion is possible.
-    spheres, inventory = sphereSearch()
-    if all(p in inventory for p in Progress):
+    inventoryMask = sphereSearch()
+    if inventoryMask == allProgressMask:
         print(f"Generated a winnable seed on attempt #{attemptNumber}")
         print()
         break
@@ -5142,7 +5328,7 @@ while True:
 
 # Optional: Print the spoiler log.
 if args.spoiler_log:
-    for i, sphere in enumerate(spheres):
+    for i, sphere in enumerate(spoilerSpheres()):
         print(f"Sphere {i}")
         for location, prize in sphere:
             print(f"{location.region.name:<60}   {location.description:<30} --> {prize.name}")
@@ -5159,12 +5345,32 @@ if args.input_file is None:
 # APPLY THE CHANGES TO THE ROM
 ########################################################################
 
+# Little-endian 16-bit words are read and written throughout the
+# patches below, so compile their format once.
+uint16 = struct.Struct("<H")
+
 # Helper function for writing blocks of bytes.
 def writeHelper(buffer, offset, data):
     nextOffset = offset + len(data)
     buffer[offset:nextOffset] = data
     return nextOffset
 
+# Helper function for turning a list of hex strings into bytes.
+# The list can also contain blocks of bytes copied verbatim from the ROM.
+# Each run of hex strings is joined and decoded in a single call.
+def hexHelper(hexList):
+    result = bytearray()
+    hexStrings = []
+    for item in hexList:
+        if isinstance(item, str):
+            hexStrings.append(item)
+        else:
+            result += bytes.fromhex("".join(hexStrings))
+            hexStrings.clear()
+            result += item
+    result += bytes.fromhex("".join(hexStrings))
+    return result
+
 # Helper function for replacing entire behaviour scripts.
 def scriptHelper(scriptNumber, argsLen, returnLen, offset, scratchLen, maxStackLen, commandList):
     #print(f"DEBUG - Writing script {scriptNumber:3X} to offset {offset:X}")
@@ -5177,24 +5383,28 @@ def scriptHelper(scriptNumber, argsLen, returnLen, offset, scratchLen, maxStackL
     loromBank = 0x80 | (offset // 0x8000)
     romBytes[0x15970 + scriptNumber] = loromBank
     loromOffset = 0x8000 | (offset % 0x8000)
-    struct.pack_into("<H", romBytes, 0x15D18 + (2 * scriptNumber), loromOffset)
+    uint16.pack_into(romBytes, 0x15D18 + (2 * scriptNumber), loromOffset)
+    commandBytes = hexHelper(commandList)
+    nextOffset = offset + 2 + len(commandBytes)
     romBytes[offset + 0] = scratchLen
     romBytes[offset + 1] = maxStackLen
-    nextOffset = writeHelper(romBytes, offset + 2, bytes.fromhex(' '.join(commandList)))
+    romBytes[offset + 2:nextOffset] = commandBytes
     return nextOffset
 
+# Helper function for repointing [58 xx] behaviour script commands.
+# The handler addresses, argument counts and return lengths live in
+# three separate tables, indexed by the second byte of the command.
+def commandHelper(command, address, argsCount, returnLen):
+    uint16.pack_into(romBytes, 0x15604 + (2 * command), address)
+    romBytes[0x15895 + command] = argsCount
+    romBytes[0x157BA + command] = returnLen
+
 # Add four empty 32 KiB banks to the end of the ROM.
-romBytes.extend([0x00] * (4 * 0x8000))
+romBytes.extend(bytes(4 * 0x8000))
 romBytes[0x7FD7] = 0x0B
 
 # Write the new entity IDs.
-for region in regions.values():
-    for location in region.locations:
-        if location.category != Category.CONSTANT:
-            entityID = struct.pack("<H", location.current.entityAddress - 0x6B031)
-            writeHelper(romBytes, location.address, entityID)
-
-# Set the 0x80 flag for all visible (i.e. not hidden) randomized items.
+# Also set the 0x80 flag for all visible (i.e. not hidden) randomized items.
 # In vanilla, the 0x80 flag would start clear for all items, and only
 # be set on hidden items when they became visible. Always-visible items
 # would ignore the flag entirely, and initially-hidden items would wait
@@ -5205,14 +5415,21 @@ for region in regions.values():
 # Since every item is now checking the 0x80 flag, we need to set it for
 # items in "always visible" locations, otherwise they'll start out
 # hidden and remain that way indefinitely.
-for region in regions.values():
-    for location in region.locations:
-        if location.category != Category.CONSTANT:
-            memoryPointer = struct.unpack_from("<H", romBytes, location.current.entityAddress + 1)[0]
-            if memoryPointer != 0:
-                memoryPointer -= 0x2E00
-                if not location.hidden:
-                    initialItemState[memoryPointer + 1] |= 0x80
+placedLocations = [
+    location
+    for region in regions.values()
+    for location in region.locations
+    if location.category != Category.CONSTANT
+]
+for location in placedLocations:
+    entityAddress = location.current.entityAddress
+    entityID = uint16.pack(entityAddress - 0x6B031)
+    writeHelper(romBytes, location.address, entityID)
+    memoryPointer = uint16.unpack_from(romBytes, entityAddress + 1)[0]
+    if memoryPointer != 0:
+        memoryPointer -= 0x2E00
+        if not location.hidden:
+            initialItemState[memoryPointer + 1] |= 0x80
 
 # Rewrite the 00/FE8B "print text in a window" function.
 # 00/FE8B is the code behind the [58 C7] "print text in a window" command
@@ -5225,7 +5442,7 @@ for region in regions.values():
 # unused) command to 00/FE8B, to create a new command that behaves like
 # [58 C7] but also returns the text-window-slot number. This new command
 # will help us create text windows with dynamic content.
-writeHelper(romBytes, 0x7E8B, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x7E8B, hexHelper([
     "A5 08",    # 00/FE8B: LDA $08
     "C9 00 04", # 00/FE8D: CMP #$0400
     "D0 06",    # 00/FE90: BNE $FE98
@@ -5267,7 +5484,7 @@ writeHelper(romBytes, 0x7E8B, bytes.fromhex(' '.join([
     "9D 32 02", # 00/FED7: STA $0232,X
     "85 00",    # 00/FEDA: STA $00     ; $00 = "text-window-slot" number
     "60",       # 00/FEDC: RTS
-])))
+]))
 
 # Repoint [58 3D] to 00/FE8B.
 # [58 3D] is a behaviour script command that draws a text window and
@@ -5280,11 +5497,12 @@ writeHelper(romBytes, 0x7E8B, bytes.fromhex(' '.join([
 # With this repointing, [58 3D] behaves like [58 C7] (same arguments),
 # but additionally returns the "text-window-slot" number. This will
 # help us create text windows with dynamic content.
-struct.pack_into("<H", romBytes, 0x15604 + (2 * 0x3D), 0xFE8B)
-# Command [58 3D] now takes 7 stack items as arguments instead of 5.
-romBytes[0x15895 + 0x3D] = 0x07
-# Command [58 3D] now returns 2 bytes (= 1 stack item) upon completion.
-romBytes[0x157BA + 0x3D] = 0x02
+commandHelper(
+    command   = 0x3D,
+    address   = 0xFE8B,
+    argsCount = 0x07, # Command [58 3D] now takes 7 stack items as arguments instead of 5
+    returnLen = 0x02, # Command [58 3D] now returns 2 bytes (= 1 stack item) upon completion
+)
 
 # The sixth argument for [58 C7] (and now [58 3D]) is a text-id.
 # Text-ids are indices into a table of short text pointers at 0x5980.
@@ -5293,7 +5511,7 @@ romBytes[0x157BA + 0x3D] = 0x02
 # No such text-id exists in vanilla, so let's repoint one that's not
 # in use: 0x260, which corresponds to the "Winter CES'93" message.
 # The new pointer destination will be the empty string at 0xE8765.
-struct.pack_into("<H", romBytes, 0x5980 + (2 * 0x260), 0x0765)
+uint16.pack_into(romBytes, 0x5980 + (2 * 0x260), 0x0765)
 
 # Repoint [58 53] to 00/FE33.
 # It looks like [58 53] lets you set flags to apply text effects (e.g.
@@ -5301,11 +5519,12 @@ struct.pack_into("<H", romBytes, 0x5980 + (2 * 0x260), 0x0765)
 # so I'm repointing it.
 # 00/FE33 is a function that takes two arguments (a text-window-slot
 # number and a text pointer), and prints the latter onto the former.
-struct.pack_into("<H", romBytes, 0x15604 + (2 * 0x53), 0xFE33)
-# Command [58 53] now takes 2 stack items as arguments.
-romBytes[0x15895 + 0x53] = 0x02
-# Command [58 53] now returns 0 bytes (= 0 stack items) upon completion.
-romBytes[0x157BA + 0x53] = 0x00
+commandHelper(
+    command   = 0x53,
+    address   = 0xFE33,
+    argsCount = 0x02, # Command [58 53] now takes 2 stack items as arguments
+    returnLen = 0x00, # Command [58 53] now returns 0 bytes (= 0 stack items) upon completion
+)
 
 # Repoint [58 0E] to 00/FA76.
 # It looks like [58 0E] does... something related to text windows?
@@ -5313,11 +5532,12 @@ romBytes[0x157BA + 0x53] = 0x00
 # 00/FA76 is a function that takes three arguments: a text-window-slot
 # number, an X coordinate, and a Y coordinate. It sets the window's
 # text cursor position to the given coordinates.
-struct.pack_into("<H", romBytes, 0x15604 + (2 * 0x0E), 0xFA76)
-# Command [58 0E] now takes 3 stack items as arguments.
-romBytes[0x15895 + 0x0E] = 0x03
-# Command [58 0E] now returns 0 bytes (= 0 stack items) upon completion.
-romBytes[0x157BA + 0x0E] = 0x00
+commandHelper(
+    command   = 0x0E,
+    address   = 0xFA76,
+    argsCount = 0x03, # Command [58 0E] now takes 3 stack items as arguments
+    returnLen = 0x00, # Command [58 0E] now returns 0 bytes (= 0 stack items) upon completion
+)
 
 # Change the behaviour of [58 19].
 # [58 19] takes an object-id, looks at the 0x66FB0 "appearance" entry
@@ -5396,596 +5616,131 @@ expandedOffset = scriptHelper(
 # Weapons
 # ------------------------------------------------------------------------
 
-# Zip-Gun
-expandedOffset = scriptHelper(
-    scriptNumber = 0x218,
-    argsLen      = 0x02, # Script 0x218 now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x218 now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x0A, # Header byte: Maximum stack height of 0x0A bytes (= 5 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 01",    # 001C: Push unsigned byte 0x01     1 = Strength required
-        "00 00",    # 001E: Push unsigned byte 0x00     0 = Accuracy
-        "00 03",    # 0020: Push unsigned byte 0x03     3 = Attack
-        "00 06",    # 0022: Push unsigned byte 0x06     6 = Type (light)
-        "C2",       # 0024: Push unsigned byte from $13+00 <-- Spawn index
-        "52 11 00", # 0025: Execute behaviour script 0x11 = Common code for weapons
-        "56",       # 0028: End
-    ],
-)
-# Zip-Gun: Use the Beretta Pistol's sprite data (0xD420 --> 0xD052)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xB6), 0xD052)
-# Zip-Gun: Increase the Zip-Gun's sprite priority
-romBytes[0x6B031] |= 0x40
+# Weapons and armor share the start of their behaviour scripts: if the
+# item has no owner, draw it and wait to be picked up. Either way, the
+# script continues at 001C, where the stats are pushed and the common
+# weapon or armor code takes over.
+pickupScriptStart = [
+    "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
+    "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
+    "58 C5",    # 0003: Check if object has an owner
+    "46 1C 00", # 0005: If yes, jump to 001C
+    "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
+    "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
+    "C0",       # 000C: Push zero
+    "00 10",    # 000D: Push unsigned byte 0x10
+    "58 9E",    # 000F: Register menu options / time delay
+    "BC",       # 0011: Pop
+    "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
+    "58 6F",    # 0013: Set object's owner to Jake
+    "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
+    "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
+    "58 B8",    # 0019: Despawn object
+    "56",       # 001B: End
+]
+
+# All of the weapons use the same behaviour script, apart from the stats.
+# Weapon types: 0 = heavy, 1 = auto, 6 = light
+weaponStats = [
+    # Script  Strength  Accuracy  Attack  Type
+    (0x218,   0x01,     0x00,     0x03,   0x06), # Zip-Gun
+    (0x1BF,   0x01,     0x01,     0x03,   0x06), # Beretta Pistol
+    (0x34F,   0x01,     0x01,     0x03,   0x06), # Colt L36 Pistol
+    (0x286,   0x01,     0x01,     0x04,   0x06), # Fichetti L. Pistol
+    (0xAA,    0x02,     0x02,     0x04,   0x00), # Viper H. Pistol
+    (0x29A,   0x03,     0x02,     0x06,   0x00), # Warhawk H. Pistol
+    (0x1F,    0x04,     0x02,     0x08,   0x00), # T-250 Shotgun
+    (0x1A7,   0x04,     0x03,     0x08,   0x01), # Uzi III SMG
+    (0x16C,   0x05,     0x02,     0x0A,   0x00), # HK 277 A. Rifle
+    (0x315,   0x05,     0x06,     0x14,   0x00), # AS-7 A. Cannon
+]
+for scriptNumber, strength, accuracy, attack, weaponType in weaponStats:
+    expandedOffset = scriptHelper(
+        scriptNumber = scriptNumber,
+        argsLen      = 0x02, # Script now takes 2 bytes (= 1 stack item) as arguments
+        returnLen    = 0x00, # Script now returns 0 bytes (= 0 stack items) upon completion
+        offset       = expandedOffset,
+        scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
+        maxStackLen  = 0x0A, # Header byte: Maximum stack height of 0x0A bytes (= 5 stack items)
+        commandList  = pickupScriptStart + [
+            f"00 {strength:02X}",   # 001C: Push unsigned byte <-- Strength required
+            f"00 {accuracy:02X}",   # 001E: Push unsigned byte <-- Accuracy
+            f"00 {attack:02X}",     # 0020: Push unsigned byte <-- Attack
+            f"00 {weaponType:02X}", # 0022: Push unsigned byte <-- Type
+            "C2",       # 0024: Push unsigned byte from $13+00 <-- Spawn index
+            "52 11 00", # 0025: Execute behaviour script 0x11 = Common code for weapons
+            "56",       # 0028: End
+        ],
+    )
+
+# Make the other weapons use the Beretta Pistol's sprite data (0xD052).
+# The vanilla sprite-data pointers are noted alongside.
+for spriteNumber in [
+    0xB6,  # Zip-Gun            (0xD420 --> 0xD052)
+    0x112, # Colt L36 Pistol    (0xED8A --> 0xD052)
+    0xCC,  # Fichetti L. Pistol (0xE018 --> 0xD052)
+    0xA9,  # Viper H. Pistol    (0xD066 --> 0xD052)
+    0xCD,  # Warhawk H. Pistol  (0xE02C --> 0xD052)
+    0xAB,  # T-250 Shotgun      (0xD08E --> 0xD052)
+    0xEE,  # Uzi III SMG        (0xE97C --> 0xD052)
+    0xAA,  # HK 277 A. Rifle    (0xD07A --> 0xD052)
+    0xCE,  # AS-7 A. Cannon     (0xE040 --> 0xD052)
+]:
+    uint16.pack_into(romBytes, 0x66D8A + (2 * spriteNumber), 0xD052)
+
+# Increase the sprite priority of some of the weapons
+romBytes[0x6B031] |= 0x40 # Zip-Gun
+romBytes[0x6C324] |= 0x40 # Fichetti L. Pistol
+romBytes[0x6CB90] |= 0x40 # AS-7 A. Cannon
 
-# Beretta Pistol
-expandedOffset = scriptHelper(
-    scriptNumber = 0x1BF,
-    argsLen      = 0x02, # Script 0x1BF now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x1BF now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x0A, # Header byte: Maximum stack height of 0x0A bytes (= 5 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 01",    # 001C: Push unsigned byte 0x01     1 = Strength required
-        "00 01",    # 001E: Push unsigned byte 0x01     1 = Accuracy
-        "00 03",    # 0020: Push unsigned byte 0x03     3 = Attack
-        "00 06",    # 0022: Push unsigned byte 0x06     6 = Type (light)
-        "C2",       # 0024: Push unsigned byte from $13+00 <-- Spawn index
-        "52 11 00", # 0025: Execute behaviour script 0x11 = Common code for weapons
-        "56",       # 0028: End
-    ],
-)
 # Beretta Pistol: Change the behaviour script for Jetboy's Beretta Pistol
 # from 0x34F (Colt L36 Pistol) to 0x1BF (Beretta Pistol).
 # In vanilla, 0x1BF was a more complicated script to handle the Beretta
 # in the alley, while 0x34F just specified weapon stats.
 # The Beretta and the Colt L36 have the same stats, so it looks like the
 # devs used the simpler script for Jetboy's gun as a shortcut.
-struct.pack_into("<H", romBytes, 0x6C981, 0x01BF)
-
-# Colt L36 Pistol
-expandedOffset = scriptHelper(
-    scriptNumber = 0x34F,
-    argsLen      = 0x02, # Script 0x34F now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x34F now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x0A, # Header byte: Maximum stack height of 0x0A bytes (= 5 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 01",    # 001C: Push unsigned byte 0x01     1 = Strength required
-        "00 01",    # 001E: Push unsigned byte 0x01     1 = Accuracy
-        "00 03",    # 0020: Push unsigned byte 0x03     3 = Attack
-        "00 06",    # 0022: Push unsigned byte 0x06     6 = Type (light)
-        "C2",       # 0024: Push unsigned byte from $13+00 <-- Spawn index
-        "52 11 00", # 0025: Execute behaviour script 0x11 = Common code for weapons
-        "56",       # 0028: End
-    ],
-)
-# Colt L36 Pistol: Use the Beretta Pistol's sprite data (0xED8A --> 0xD052)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0x112), 0xD052)
-
-# Fichetti L. Pistol
-expandedOffset = scriptHelper(
-    scriptNumber = 0x286,
-    argsLen      = 0x02, # Script 0x286 now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x286 now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x0A, # Header byte: Maximum stack height of 0x0A bytes (= 5 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 01",    # 001C: Push unsigned byte 0x01     1 = Strength required
-        "00 01",    # 001E: Push unsigned byte 0x01     1 = Accuracy
-        "00 04",    # 0020: Push unsigned byte 0x04     4 = Attack
-        "00 06",    # 0022: Push unsigned byte 0x06     6 = Type (light)
-        "C2",       # 0024: Push unsigned byte from $13+00 <-- Spawn index
-        "52 11 00", # 0025: Execute behaviour script 0x11 = Common code for weapons
-        "56",       # 0028: End
-    ],
-)
-# Fichetti L. Pistol: Use the Beretta Pistol's sprite data (0xE018 --> 0xD052)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xCC), 0xD052)
-# Fichetti L. Pistol: Increase the Fichetti L. Pistol's sprite priority
-romBytes[0x6C324] |= 0x40
-
-# Viper H. Pistol
-expandedOffset = scriptHelper(
-    scriptNumber = 0xAA,
-    argsLen      = 0x02, # Script 0xAA now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0xAA now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x0A, # Header byte: Maximum stack height of 0x0A bytes (= 5 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 02",    # 001C: Push unsigned byte 0x02     2 = Strength required
-        "00 02",    # 001E: Push unsigned byte 0x02     2 = Accuracy
-        "00 04",    # 0020: Push unsigned byte 0x04     4 = Attack
-        "00 00",    # 0022: Push unsigned byte 0x00     0 = Type (heavy)
-        "C2",       # 0024: Push unsigned byte from $13+00 <-- Spawn index
-        "52 11 00", # 0025: Execute behaviour script 0x11 = Common code for weapons
-        "56",       # 0028: End
-    ],
-)
-# Viper H. Pistol: Use the Beretta Pistol's sprite data (0xD066 --> 0xD052)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xA9), 0xD052)
-
-# Warhawk H. Pistol
-expandedOffset = scriptHelper(
-    scriptNumber = 0x29A,
-    argsLen      = 0x02, # Script 0x29A now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x29A now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x0A, # Header byte: Maximum stack height of 0x0A bytes (= 5 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 03",    # 001C: Push unsigned byte 0x03     3 = Strength required
-        "00 02",    # 001E: Push unsigned byte 0x02     2 = Accuracy
-        "00 06",    # 0020: Push unsigned byte 0x06     6 = Attack
-        "00 00",    # 0022: Push unsigned byte 0x00     0 = Type (heavy)
-        "C2",       # 0024: Push unsigned byte from $13+00 <-- Spawn index
-        "52 11 00", # 0025: Execute behaviour script 0x11 = Common code for weapons
-        "56",       # 0028: End
-    ],
-)
-# Warhawk H. Pistol: Use the Beretta Pistol's sprite data (0xE02C --> 0xD052)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xCD), 0xD052)
-
-# T-250 Shotgun
-expandedOffset = scriptHelper(
-    scriptNumber = 0x1F,
-    argsLen      = 0x02, # Script 0x1F now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x1F now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x0A, # Header byte: Maximum stack height of 0x0A bytes (= 5 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 04",    # 001C: Push unsigned byte 0x04     4 = Strength required
-        "00 02",    # 001E: Push unsigned byte 0x02     2 = Accuracy
-        "00 08",    # 0020: Push unsigned byte 0x08     8 = Attack
-        "00 00",    # 0022: Push unsigned byte 0x00     0 = Type (heavy)
-        "C2",       # 0024: Push unsigned byte from $13+00 <-- Spawn index
-        "52 11 00", # 0025: Execute behaviour script 0x11 = Common code for weapons
-        "56",       # 0028: End
-    ],
-)
-# T-250 Shotgun: Use the Beretta Pistol's sprite data (0xD08E --> 0xD052)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xAB), 0xD052)
-
-# Uzi III SMG
-expandedOffset = scriptHelper(
-    scriptNumber = 0x1A7,
-    argsLen      = 0x02, # Script 0x1A7 now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x1A7 now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x0A, # Header byte: Maximum stack height of 0x0A bytes (= 5 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 04",    # 001C: Push unsigned byte 0x04     4 = Strength required
-        "00 03",    # 001E: Push unsigned byte 0x03     3 = Accuracy
-        "00 08",    # 0020: Push unsigned byte 0x08     8 = Attack
-        "00 01",    # 0022: Push unsigned byte 0x01     1 = Type (auto)
-        "C2",       # 0024: Push unsigned byte from $13+00 <-- Spawn index
-        "52 11 00", # 0025: Execute behaviour script 0x11 = Common code for weapons
-        "56",       # 0028: End
-    ],
-)
-# Uzi III SMG: Use the Beretta Pistol's sprite data (0xE97C --> 0xD052)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xEE), 0xD052)
-
-# HK 277 A. Rifle
-expandedOffset = scriptHelper(
-    scriptNumber = 0x16C,
-    argsLen      = 0x02, # Script 0x16C now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x16C now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x0A, # Header byte: Maximum stack height of 0x0A bytes (= 5 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 05",    # 001C: Push unsigned byte 0x05     5 = Strength required
-        "00 02",    # 001E: Push unsigned byte 0x02     2 = Accuracy
-        "00 0A",    # 0020: Push unsigned byte 0x0A    10 = Attack
-        "00 00",    # 0022: Push unsigned byte 0x00     0 = Type (heavy)
-        "C2",       # 0024: Push unsigned byte from $13+00 <-- Spawn index
-        "52 11 00", # 0025: Execute behaviour script 0x11 = Common code for weapons
-        "56",       # 0028: End
-    ],
-)
-# HK 277 A. Rifle: Use the Beretta Pistol's sprite data (0xD07A --> 0xD052)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xAA), 0xD052)
-
-# AS-7 A. Cannon
-expandedOffset = scriptHelper(
-    scriptNumber = 0x315,
-    argsLen      = 0x02, # Script 0x315 now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x315 now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x0A, # Header byte: Maximum stack height of 0x0A bytes (= 5 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 05",    # 001C: Push unsigned byte 0x05     5 = Strength required
-        "00 06",    # 001E: Push unsigned byte 0x06     6 = Accuracy
-        "00 14",    # 0020: Push unsigned byte 0x14    20 = Attack
-        "00 00",    # 0022: Push unsigned byte 0x00     0 = Type (heavy)
-        "C2",       # 0024: Push unsigned byte from $13+00 <-- Spawn index
-        "52 11 00", # 0025: Execute behaviour script 0x11 = Common code for weapons
-        "56",       # 0028: End
-    ],
-)
-# AS-7 A. Cannon: Use the Beretta Pistol's sprite data (0xE040 --> 0xD052)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xCE), 0xD052)
-# AS-7 A. Cannon: Increase the AS-7 A. Cannon's sprite priority
-romBytes[0x6CB90] |= 0x40
+uint16.pack_into(romBytes, 0x6C981, 0x01BF)
 
 # ------------------------------------------------------------------------
 # Armor
 # ------------------------------------------------------------------------
 
-# Leather Jacket
-expandedOffset = scriptHelper(
-    scriptNumber = 0x292,
-    argsLen      = 0x02, # Script 0x292 now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x292 now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x06, # Header byte: Maximum stack height of 0x06 bytes (= 3 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 01",    # 001C: Push unsigned byte 0x01     1 = Strength required
-        "00 01",    # 001E: Push unsigned byte 0x01     1 = Defense
-        "C2",       # 0020: Push unsigned byte from $13+00 <-- Spawn index
-        "52 20 03", # 0021: Execute behaviour script 0x320 = Common code for armor
-        "56",       # 0024: End
-    ],
-)
-
-# Mesh Jacket
-expandedOffset = scriptHelper(
-    scriptNumber = 0x1A8,
-    argsLen      = 0x02, # Script 0x1A8 now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x1A8 now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x06, # Header byte: Maximum stack height of 0x06 bytes (= 3 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 02",    # 001C: Push unsigned byte 0x02     2 = Strength required
-        "00 02",    # 001E: Push unsigned byte 0x02     2 = Defense
-        "C2",       # 0020: Push unsigned byte from $13+00 <-- Spawn index
-        "52 20 03", # 0021: Execute behaviour script 0x320 = Common code for armor
-        "56",       # 0024: End
-    ],
-)
-
-# Bulletproof Vest
-expandedOffset = scriptHelper(
-    scriptNumber = 0xA5,
-    argsLen      = 0x02, # Script 0xA5 now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0xA5 now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x06, # Header byte: Maximum stack height of 0x06 bytes (= 3 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 03",    # 001C: Push unsigned byte 0x03     3 = Strength required
-        "00 03",    # 001E: Push unsigned byte 0x03     3 = Defense
-        "C2",       # 0020: Push unsigned byte from $13+00 <-- Spawn index
-        "52 20 03", # 0021: Execute behaviour script 0x320 = Common code for armor
-        "56",       # 0024: End
-    ],
-)
-# Bulletproof Vest: Use the Mesh Jacket's sprite data (0xE068 --> 0xE054)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xD0), 0xE054)
-
-# Concealed Jacket
-expandedOffset = scriptHelper(
-    scriptNumber = 0x19C,
-    argsLen      = 0x02, # Script 0x19C now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x19C now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x06, # Header byte: Maximum stack height of 0x06 bytes (= 3 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 04",    # 001C: Push unsigned byte 0x04     4 = Strength required
-        "00 04",    # 001E: Push unsigned byte 0x04     4 = Defense
-        "C2",       # 0020: Push unsigned byte from $13+00 <-- Spawn index
-        "52 20 03", # 0021: Execute behaviour script 0x320 = Common code for armor
-        "56",       # 0024: End
-    ],
-)
-# Concealed Jacket: Use the Mesh Jacket's sprite data (0xE07C --> 0xE054)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xD1), 0xE054)
-
-# Partial Bodysuit
-expandedOffset = scriptHelper(
-    scriptNumber = 0x2BA,
-    argsLen      = 0x02, # Script 0x2BA now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x2BA now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x06, # Header byte: Maximum stack height of 0x06 bytes (= 3 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 05",    # 001C: Push unsigned byte 0x05     5 = Strength required
-        "00 05",    # 001E: Push unsigned byte 0x05     5 = Defense
-        "C2",       # 0020: Push unsigned byte from $13+00 <-- Spawn index
-        "52 20 03", # 0021: Execute behaviour script 0x320 = Common code for armor
-        "56",       # 0024: End
-    ],
-)
-# Partial Bodysuit: Use the Mesh Jacket's sprite data (0xE090 --> 0xE054)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xD2), 0xE054)
+# All of the armor uses the same behaviour script, apart from the stats.
+armorStats = [
+    # Script  Strength  Defense
+    (0x292,   0x01,     0x01), # Leather Jacket
+    (0x1A8,   0x02,     0x02), # Mesh Jacket
+    (0xA5,    0x03,     0x03), # Bulletproof Vest
+    (0x19C,   0x04,     0x04), # Concealed Jacket
+    (0x2BA,   0x05,     0x05), # Partial Bodysuit
+    (0x1BE,   0x06,     0x06), # Full Bodysuit
+]
+for scriptNumber, strength, defense in armorStats:
+    expandedOffset = scriptHelper(
+        scriptNumber = scriptNumber,
+        argsLen      = 0x02, # Script now takes 2 bytes (= 1 stack item) as arguments
+        returnLen    = 0x00, # Script now returns 0 bytes (= 0 stack items) upon completion
+        offset       = expandedOffset,
+        scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
+        maxStackLen  = 0x06, # Header byte: Maximum stack height of 0x06 bytes (= 3 stack items)
+        commandList  = pickupScriptStart + [
+            f"00 {strength:02X}", # 001C: Push unsigned byte <-- Strength required
+            f"00 {defense:02X}",  # 001E: Push unsigned byte <-- Defense
+            "C2",       # 0020: Push unsigned byte from $13+00 <-- Spawn index
+            "52 20 03", # 0021: Execute behaviour script 0x320 = Common code for armor
+            "56",       # 0024: End
+        ],
+    )
 
-# Full Bodysuit
-expandedOffset = scriptHelper(
-    scriptNumber = 0x1BE,
-    argsLen      = 0x02, # Script 0x1BE now takes 2 bytes (= 1 stack item) as arguments
-    returnLen    = 0x00, # Script 0x1BE now returns 0 bytes (= 0 stack items) upon completion
-    offset       = expandedOffset,
-    scratchLen   = 0x01, # Header byte: Script uses 0x01 bytes of $13+xx space
-    maxStackLen  = 0x06, # Header byte: Maximum stack height of 0x06 bytes (= 3 stack items)
-    commandList  = [
-        "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
-        "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
-        "58 C5",    # 0003: Check if object has an owner
-        "46 1C 00", # 0005: If yes, jump to 001C
-        "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
-        "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-        "C0",       # 000C: Push zero
-        "00 10",    # 000D: Push unsigned byte 0x10
-        "58 9E",    # 000F: Register menu options / time delay
-        "BC",       # 0011: Pop
-        "C2",       # 0012: Push unsigned byte from $13+00 <-- Spawn index
-        "58 6F",    # 0013: Set object's owner to Jake
-        "52 4B 00", # 0015: Execute behaviour script 0x4B = "Got item" sound effect
-        "C2",       # 0018: Push unsigned byte from $13+00 <-- Spawn index
-        "58 B8",    # 0019: Despawn object
-        "56",       # 001B: End
-        "00 06",    # 001C: Push unsigned byte 0x06     6 = Strength required
-        "00 06",    # 001E: Push unsigned byte 0x06     6 = Defense
-        "C2",       # 0020: Push unsigned byte from $13+00 <-- Spawn index
-        "52 20 03", # 0021: Execute behaviour script 0x320 = Common code for armor
-        "56",       # 0024: End
-    ],
-)
-# Full Bodysuit: Use the Mesh Jacket's sprite data (0xE0A4 --> 0xE054)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xD3), 0xE054)
+# Make the heavier armor use the Mesh Jacket's sprite data (0xE054).
+# The vanilla sprite-data pointers are noted alongside.
+for spriteNumber in [
+    0xD0, # Bulletproof Vest (0xE068 --> 0xE054)
+    0xD1, # Concealed Jacket (0xE07C --> 0xE054)
+    0xD2, # Partial Bodysuit (0xE090 --> 0xE054)
+    0xD3, # Full Bodysuit    (0xE0A4 --> 0xE054)
+]:
+    uint16.pack_into(romBytes, 0x66D8A + (2 * spriteNumber), 0xE054)
 
 # ------------------------------------------------------------------------
 # Common code for glass cases
@@ -6283,7 +6038,7 @@ equipmentPrices = {
 # - You can now sell the "free" Mesh Jacket
 
 # Tenth Street Business Man: Text before the price
-writeHelper(romBytes, 0xF2D64, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF2D64, hexHelper([
     # Old: "Quiet man, Okay. I'll give ya..."
     # New: "Quiet man, okay. I'll give ya..."
     "F7", # "Q"   = 11110111110111
@@ -6306,20 +6061,20 @@ writeHelper(romBytes, 0xF2D64, bytes.fromhex(' '.join([
     "B7", # ".."  = 01110010
     "2C", # ".\n" = 1100010
     "40",
-])))
+]))
 
 # Tenth Street Business Man: Text after the price
-writeHelper(romBytes, 0xF0D44, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF0D44, hexHelper([
     # Old: ". Deal?"
     # New: "Deal?"
     "59", # "D"   = 01011001
     "53", # "ea"  = 01010011
     "BE", # "l"   = 10111110
     "26", # "?\n" = 00100110
-])))
+]))
 
 # Oldtown Gun Shop: Text after the price
-writeHelper(romBytes, 0xF0D49, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF0D49, hexHelper([
     # Old: " for it! Still wanna sell?"
     # New: "for it! Still wanna sell?"
     "2C", # "fo"  = 00101100
@@ -6336,10 +6091,10 @@ writeHelper(romBytes, 0xF0D49, bytes.fromhex(' '.join([
     "DE", # "ll"  = 11110010
     "44", # "?\n" = 00100110
     "C0",
-])))
+]))
 
 # Dark Blade Gun Shop: Text before the price
-writeHelper(romBytes, 0xF2D34, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF2D34, hexHelper([
     # Old: "Hmm.. Okay. How about if I give you"
     # New: "Hmm... okay. How about if I give you"
     "7D", # "H"  = 011111011
@@ -6363,7 +6118,7 @@ writeHelper(romBytes, 0xF2D34, bytes.fromhex(' '.join([
     "A2", # "yo" = 1010001
     "63", # "u"  = 0011000
     "20", # "\n" = 110010
-])))
+]))
 
 expandedOffset = scriptHelper(
     scriptNumber = 0x1E3,
@@ -6387,7 +6142,7 @@ expandedOffset = scriptHelper(
         "AA",       # 0014: Check if equal
         "44 20 00", # 0015: If not equal, jump to CHECK_IF_COLT_L36_PISTOL
         # BERETTA_PISTOL
-        f"""14 {struct.pack("<H", equipmentPrices[0x1952]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x1952]).hex(' ')}""",
                     # 0018: Push short 0x####   <-- Equipment price
         "34 04",    # 001B: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 001D: Jump to CHECK_IF_SELLABLE
@@ -6397,7 +6152,7 @@ expandedOffset = scriptHelper(
         "AA",       # 0025: Check if equal
         "44 31 00", # 0026: If not equal, jump to CHECK_IF_FICHETTI_L_PISTOL
         # COLT_L36_PISTOL
-        f"""14 {struct.pack("<H", equipmentPrices[0x17C3]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x17C3]).hex(' ')}""",
                     # 0029: Push short 0x####   <-- Equipment price
         "34 04",    # 002C: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 002E: Jump to CHECK_IF_SELLABLE
@@ -6407,7 +6162,7 @@ expandedOffset = scriptHelper(
         "AA",       # 0036: Check if equal
         "44 42 00", # 0037: If not equal, jump to CHECK_IF_VIPER_H_PISTOL___3000
         # FICHETTI_L_PISTOL
-        f"""14 {struct.pack("<H", equipmentPrices[0x12F3]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x12F3]).hex(' ')}""",
                     # 003A: Push short 0x####   <-- Equipment price
         "34 04",    # 003D: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 003F: Jump to CHECK_IF_SELLABLE
@@ -6417,7 +6172,7 @@ expandedOffset = scriptHelper(
         "AA",       # 0047: Check if equal
         "44 53 00", # 0048: If not equal, jump to CHECK_IF_VIPER_H_PISTOL___4000
         # VIPER_H_PISTOL___3000
-        f"""14 {struct.pack("<H", equipmentPrices[0x0157]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x0157]).hex(' ')}""",
                     # 004B: Push short 0x####   <-- Equipment price
         "34 04",    # 004E: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 0050: Jump to CHECK_IF_SELLABLE
@@ -6427,7 +6182,7 @@ expandedOffset = scriptHelper(
         "AA",       # 0058: Check if equal
         "44 64 00", # 0059: If not equal, jump to CHECK_IF_WARHAWK_H_PISTOL
         # VIPER_H_PISTOL___4000
-        f"""14 {struct.pack("<H", equipmentPrices[0x0150]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x0150]).hex(' ')}""",
                     # 005C: Push short 0x####   <-- Equipment price
         "34 04",    # 005F: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 0061: Jump to CHECK_IF_SELLABLE
@@ -6437,7 +6192,7 @@ expandedOffset = scriptHelper(
         "AA",       # 0069: Check if equal
         "44 75 00", # 006A: If not equal, jump to CHECK_IF_T_250_SHOTGUN___12000
         # WARHAWK_H_PISTOL
-        f"""14 {struct.pack("<H", equipmentPrices[0x013B]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x013B]).hex(' ')}""",
                     # 006D: Push short 0x####   <-- Equipment price
         "34 04",    # 0070: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 0072: Jump to CHECK_IF_SELLABLE
@@ -6447,7 +6202,7 @@ expandedOffset = scriptHelper(
         "AA",       # 007A: Check if equal
         "44 86 00", # 007B: If not equal, jump to CHECK_IF_T_250_SHOTGUN___15000
         # T_250_SHOTGUN___12000
-        f"""14 {struct.pack("<H", equipmentPrices[0x0276]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x0276]).hex(' ')}""",
                     # 007E: Push short 0x####   <-- Equipment price
         "34 04",    # 0081: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 0083: Jump to CHECK_IF_SELLABLE
@@ -6457,7 +6212,7 @@ expandedOffset = scriptHelper(
         "AA",       # 008B: Check if equal
         "44 97 00", # 008C: If not equal, jump to CHECK_IF_UZI_III_SMG
         # T_250_SHOTGUN___15000
-        f"""14 {struct.pack("<H", equipmentPrices[0x0261]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x0261]).hex(' ')}""",
                     # 008F: Push short 0x####   <-- Equipment price
         "34 04",    # 0092: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 0094: Jump to CHECK_IF_SELLABLE
@@ -6467,7 +6222,7 @@ expandedOffset = scriptHelper(
         "AA",       # 009C: Check if equal
         "44 A8 00", # 009D: If not equal, jump to CHECK_IF_HK_277_A_RIFLE
         # UZI_III_SMG
-        f"""14 {struct.pack("<H", equipmentPrices[0x01A4]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x01A4]).hex(' ')}""",
                     # 00A0: Push short 0x####   <-- Equipment price
         "34 04",    # 00A3: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 00A5: Jump to CHECK_IF_SELLABLE
@@ -6477,7 +6232,7 @@ expandedOffset = scriptHelper(
         "AA",       # 00AD: Check if equal
         "44 B9 00", # 00AE: If not equal, jump to CHECK_IF_AS_7_A_CANNON
         # HK_277_A_RIFLE
-        f"""14 {struct.pack("<H", equipmentPrices[0x0BF3]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x0BF3]).hex(' ')}""",
                     # 00B1: Push short 0x####   <-- Equipment price
         "34 04",    # 00B4: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 00B6: Jump to CHECK_IF_SELLABLE
@@ -6487,7 +6242,7 @@ expandedOffset = scriptHelper(
         "AA",       # 00BE: Check if equal
         "44 CA 00", # 00BF: If not equal, jump to CHECK_IF_LEATHER_JACKET
         # AS_7_A_CANNON
-        f"""14 {struct.pack("<H", equipmentPrices[0x1B5F]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x1B5F]).hex(' ')}""",
                     # 00C2: Push short 0x####   <-- Equipment price
         "34 04",    # 00C5: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 00C7: Jump to CHECK_IF_SELLABLE
@@ -6497,7 +6252,7 @@ expandedOffset = scriptHelper(
         "AA",       # 00CF: Check if equal
         "44 DB 00", # 00D0: If not equal, jump to CHECK_IF_MESH_JACKET___FREE
         # LEATHER_JACKET
-        f"""14 {struct.pack("<H", equipmentPrices[0x0B21]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x0B21]).hex(' ')}""",
                     # 00D3: Push short 0x####   <-- Equipment price
         "34 04",    # 00D6: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 00D8: Jump to CHECK_IF_SELLABLE
@@ -6507,7 +6262,7 @@ expandedOffset = scriptHelper(
         "AA",       # 00E0: Check if equal
         "44 EC 00", # 00E1: If not equal, jump to CHECK_IF_MESH_JACKET___5000
         # MESH_JACKET___FREE
-        f"""14 {struct.pack("<H", equipmentPrices[0x085E]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x085E]).hex(' ')}""",
                     # 00E4: Push short 0x####   <-- Equipment price
         "34 04",    # 00E7: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 00E9: Jump to CHECK_IF_SELLABLE
@@ -6517,7 +6272,7 @@ expandedOffset = scriptHelper(
         "AA",       # 00F1: Check if equal
         "44 FD 00", # 00F2: If not equal, jump to CHECK_IF_BULLETPROOF_VEST
         # MESH_JACKET___5000
-        f"""14 {struct.pack("<H", equipmentPrices[0x0850]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x0850]).hex(' ')}""",
                     # 00F5: Push short 0x####   <-- Equipment price
         "34 04",    # 00F8: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 00FA: Jump to CHECK_IF_SELLABLE
@@ -6527,7 +6282,7 @@ expandedOffset = scriptHelper(
         "AA",       # 0102: Check if equal
         "44 0E 01", # 0103: If not equal, jump to CHECK_IF_CONCEALED_JACKET
         # BULLETPROOF_VEST
-        f"""14 {struct.pack("<H", equipmentPrices[0x18A3]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x18A3]).hex(' ')}""",
                     # 0106: Push short 0x####   <-- Equipment price
         "34 04",    # 0109: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 010B: Jump to CHECK_IF_SELLABLE
@@ -6537,7 +6292,7 @@ expandedOffset = scriptHelper(
         "AA",       # 0113: Check if equal
         "44 1F 01", # 0114: If not equal, jump to CHECK_IF_PARTIAL_BODYSUIT
         # CONCEALED_JACKET
-        f"""14 {struct.pack("<H", equipmentPrices[0x1696]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x1696]).hex(' ')}""",
                     # 0117: Push short 0x####   <-- Equipment price
         "34 04",    # 011A: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 011C: Jump to CHECK_IF_SELLABLE
@@ -6547,7 +6302,7 @@ expandedOffset = scriptHelper(
         "AA",       # 0124: Check if equal
         "44 30 01", # 0125: If not equal, jump to CHECK_IF_FULL_BODYSUIT
         # PARTIAL_BODYSUIT
-        f"""14 {struct.pack("<H", equipmentPrices[0x0770]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x0770]).hex(' ')}""",
                     # 0128: Push short 0x####   <-- Equipment price
         "34 04",    # 012B: Pop short to $13+04 <-- Selling price
         "48 3E 01", # 012D: Jump to CHECK_IF_SELLABLE
@@ -6557,7 +6312,7 @@ expandedOffset = scriptHelper(
         "AA",       # 0135: Check if equal
         "44 3E 01", # 0136: If not equal, jump to CHECK_IF_SELLABLE
         # FULL_BODYSUIT
-        f"""14 {struct.pack("<H", equipmentPrices[0x129F]).hex(' ')}""",
+        f"""14 {uint16.pack(equipmentPrices[0x129F]).hex(' ')}""",
                     # 0139: Push short 0x####   <-- Equipment price
         "34 04",    # 013C: Pop short to $13+04 <-- Selling price
         # CHECK_IF_SELLABLE
@@ -6722,7 +6477,7 @@ expandedOffset = scriptHelper(
 # alley at Tenth Street.
 
 # Change the "hmmm...." hover-description to "Keyword"
-writeHelper(romBytes, 0xEEBA4, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xEEBA4, hexHelper([
     # "Keyword"
     "1C", # "K"  = 000111000
     "3B", # "ey" = 011101111
@@ -6730,10 +6485,10 @@ writeHelper(romBytes, 0xEEBA4, bytes.fromhex(' '.join([
     "C6", # "rd" = 0110011111
     "7F", # "\n" = 110010
     "20",
-])))
+]))
 
 # Change the "hmmm...." appearance so it uses the "Tickets" sprite
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0x30), 0xA46A)
+uint16.pack_into(romBytes, 0x66D8A + (2 * 0x30), 0xA46A)
 
 # Keyword-items are inanimate objects
 # Clear the "animate" flag for the "hmmm...." appearance
@@ -6743,7 +6498,7 @@ romBytes[0x670D5] &= ~0x80
 # Since the "hmmm...." dog's conversation will become inaccessible
 # once the new script is in place, we can repurpose the bytes that
 # currently contain that conversation's lines of text.
-writeHelper(romBytes, 0xE8766, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xE8766, hexHelper([
     # Horizontal alignment fix: Start with a one-pixel-wide spacer
     "F7 DA", # "\x01" = 1111011111011010
     # "Keyword learned:"
@@ -6759,15 +6514,15 @@ writeHelper(romBytes, 0xE8766, bytes.fromhex(' '.join([
     "0A", # ":"  = 00010100000
     "0C", # "\n" = 110010
     "80",
-])))
-writeHelper(romBytes, 0xE8774, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xE8774, hexHelper([
     # "|Dog"
     "03", # "|"  = 000000111
     "84", # "Do" = 000010000
     "26", # "g"  = 10011000
     "32", # "\n" = 110010
-])))
-writeHelper(romBytes, 0xE8778, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xE8778, hexHelper([
     # "|Jester |Spirit"
     "03", # "|"  = 000000111
     "BE", # "J"  = 01111100011
@@ -6781,8 +6536,8 @@ writeHelper(romBytes, 0xE8778, bytes.fromhex(' '.join([
     "80", # "it" = 0000111
     "7C", # "\n" = 110010
     "80",
-])))
-writeHelper(romBytes, 0xE8784, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xE8784, hexHelper([
     # "|Bremerton"
     "03", # "|"  = 000000111
     "E9", # "B"  = 110100110
@@ -6791,8 +6546,8 @@ writeHelper(romBytes, 0xE8784, bytes.fromhex(' '.join([
     "15", # "rt" = 000101011
     "C2", # "on" = 1000010
     "C8", # "\n" = 110010
-])))
-writeHelper(romBytes, 0xE878B, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xE878B, hexHelper([
     # "|Laughlyn"
     "03", # "|"  = 000000111
     "F8", # "L"  = 111100010
@@ -6803,8 +6558,8 @@ writeHelper(romBytes, 0xE878B, bytes.fromhex(' '.join([
     "D5", # "n"  = 10101111
     "F9", # "\n" = 110010
     "00",
-])))
-writeHelper(romBytes, 0xE8794, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xE8794, hexHelper([
     # "|Volcano"
     "03", # "|"  = 000000111
     "B3", # "V"  = 0110011110
@@ -6813,7 +6568,7 @@ writeHelper(romBytes, 0xE8794, bytes.fromhex(' '.join([
     "39", # "no" = 00110011
     "9E", # "\n" = 110010
     "40",
-])))
+]))
 
 # We need to free up some objects to create the new keyword-items.
 # The "shadowrunner default equipment" objects look like they're only
@@ -6821,12 +6576,15 @@ writeHelper(romBytes, 0xE8794, bytes.fromhex(' '.join([
 # we can free some up by having the runners share objects.
 # For now, let's make all of the runners with a default Mesh Jacket
 # share Jangadance's Mesh Jacket (0x0857).
-struct.pack_into("<H", romBytes, 0x1734, 0x0857) # Spatter
-struct.pack_into("<H", romBytes, 0x173C, 0x0857) # Jetboy
-struct.pack_into("<H", romBytes, 0x1744, 0x0857) # Norbert
-struct.pack_into("<H", romBytes, 0x1754, 0x0857) # Anders
-struct.pack_into("<H", romBytes, 0x177C, 0x0857) # Hamfist
-struct.pack_into("<H", romBytes, 0x1784, 0x0857) # Orifice
+for equipmentOffset in [
+    0x1734, # Spatter
+    0x173C, # Jetboy
+    0x1744, # Norbert
+    0x1754, # Anders
+    0x177C, # Hamfist
+    0x1784, # Orifice
+]:
+    uint16.pack_into(romBytes, equipmentOffset, 0x0857)
 
 # Next, we turn these freed objects into keyword-item objects.
 # Set appearance to 0x0030: "hmmm...." appearance, which we changed
@@ -6986,20 +6744,20 @@ expandedOffset = scriptHelper(
 )
 
 # Update the nuyen-item script to use the new item-drawing script
-writeHelper(romBytes, 0xF88F4, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF88F4, hexHelper([
     "52 1D 01", # 0003: Execute behaviour script 0x11D = New item-drawing script
     "48 0B 00", # 0006: Jump to 000B
-])))
+]))
 # Increase amount from 2,000 to 3,000 nuyen
-writeHelper(romBytes, 0xF8907, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF8907, hexHelper([
     "14 F4 01", # 0016: Push short 0x01F4 <-- Text-id for "3,000 nuyen." (was 0x01F5)
-])))
-writeHelper(romBytes, 0xF8913, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF8913, hexHelper([
     "00 0B",    # 0022: Push unsigned byte 0x0B <-- X coordinate of text window (was 0x0A)
-])))
-writeHelper(romBytes, 0xF8917, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF8917, hexHelper([
     "14 B8 0B", # 0026: Push short 0x0BB8 <-- Amount of nuyen (was 0x07D0)
-])))
+]))
 
 # ------------------------------------------------------------------------
 # Boss bounties
@@ -7019,7 +6777,7 @@ bossBounties = {
 
 # Replace "The vampire had 5,000 nuyen." with "Boss bounty:"
 # (The amount will be printed dynamically, like with shop items)
-writeHelper(romBytes, 0xF21A3, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF21A3, hexHelper([
     # "Boss bounty:"
     "D3", # "B"  = 110100110
     "7B", # "os" = 11110111101
@@ -7030,7 +6788,7 @@ writeHelper(romBytes, 0xF21A3, bytes.fromhex(' '.join([
     "C4", # ":"  = 00010100000
     "28",
     "32", # "\n" = 110010
-])))
+]))
 
 # ------------------------------------------------------------------------
 # Items and NPCs
@@ -7058,7 +6816,7 @@ expandedOffset = scriptHelper(
     maxStackLen  = 0x0E, # Header byte: Maximum stack height of 0x0E bytes (= 7 stack items)
     commandList  = [
         # Copy 0000-01CD from the original script
-        romBytes[0x1E926:0x1EAF4].hex(' '),
+        romBytes[0x1E926:0x1EAF4],
         # Spawn Larry at his vanilla "end of new-game cutscene" position
         "00 05",    # 01CE: Push unsigned byte 0x05
         "C2",       # 01D0: Push unsigned byte from $13+00 <-- Spawn index
@@ -7083,7 +6841,7 @@ expandedOffset = scriptHelper(
         "BE",       # 01EB: Convert to boolean
         "44 DE 01", # 01EC: If false, jump to WAIT_FOR_SCARE
         # Copy 02B8-02F4 from the original script
-        romBytes[0x1EBDE:0x1EC1B].hex(' '),
+        romBytes[0x1EBDE:0x1EC1B],
     ],
 )
 
@@ -7098,7 +6856,7 @@ expandedOffset = scriptHelper(
     maxStackLen  = 0x0E, # Header byte: Maximum stack height of 0x0E bytes (= 7 stack items)
     commandList  = [
         # Copy 0000-007D from the original script
-        romBytes[0x1EC1D:0x1EC9B].hex(' '),
+        romBytes[0x1EC1D:0x1EC9B],
         # Replace the jump-to-the-end at 007E with in-place "end" codes
         "56",       # 007E: End
         "56",       # 007F: End
@@ -7132,28 +6890,28 @@ expandedOffset = scriptHelper(
         "7E",       # 00A5: Bitwise AND
         "44 91 00", # 00A6: If false, jump to WAIT_FOR_SCARE
         # Copy 013E-01A5 from the original script
-        romBytes[0x1ED5B:0x1EDC3].hex(' '),
+        romBytes[0x1ED5B:0x1EDC3],
     ],
 )
 
 # Wooden Door <-- Between the halves of the morgue main room
 # Skip some code used by the vanilla new-game cutscene
-writeHelper(romBytes, 0x1F129, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x1F129, hexHelper([
     "48 82 00", # 0025: Jump to 0082
-])))
+]))
 
 # Slab
 # Skip some code used by the vanilla new-game cutscene
-writeHelper(romBytes, 0x1EE69, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x1EE69, hexHelper([
     "C0",       # 001E: Push zero
     "00 08",    # 001F: Push unsigned byte 0x08
     "C2",       # 0021: Push unsigned byte from $13+00 <-- Spawn index
     "58 D1",    # 0022: Display sprite with facing direction
     "48 93 00", # 0024: Jump to 0093
-])))
+]))
 # Skip the text popup for the vanilla Torn Paper
 # Reveal the new item shuffled to this location
-writeHelper(romBytes, 0x1EF5F, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x1EF5F, hexHelper([
     "C0",       # 0114: Push zero
     "BE",       # 0115: Convert to boolean
     "BE",       # 0116: Convert to boolean
@@ -7182,13 +6940,13 @@ writeHelper(romBytes, 0x1EF5F, bytes.fromhex(' '.join([
     f"14 {romBytes[0xC848F+0]:02X} {romBytes[0xC848F+1]:02X}",
                 # 012E: Push short 0x#### <-- Object-id of new item in "Torn Paper" location
     "58 0D",    # 0131: Set bits of object's flags
-])))
+]))
 
 # JAKE (morgue script 1)
 # Shorten the delay before Jake opens the Slab from inside
-writeHelper(romBytes, 0x1F040, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x1F040, hexHelper([
     "00 2D",    # 0027: Push unsigned byte 0x2D <-- Was 0xB4
-])))
+]))
 
 # JAKE (morgue script 2)
 expandedOffset = scriptHelper(
@@ -7200,7 +6958,7 @@ expandedOffset = scriptHelper(
     maxStackLen  = 0x0E, # Header byte: Maximum stack height of 0x0E bytes (= 7 stack items)
     commandList  = [
         # Copy 0000-005F from the original script
-        romBytes[0x1F3D0:0x1F430].hex(' '),
+        romBytes[0x1F3D0:0x1F430],
         # Activate the "custom new-game actions" script
         "00 80",    # 0060: Push unsigned byte 0x80
         "14 15 0E", # 0062: Push short 0x0E15 <-- Object-id of "new-game mortician dialogue" object
@@ -7323,22 +7081,22 @@ expandedOffset = scriptHelper(
 # TODO: Matchbox <-- Not currently subject to randomization
 
 # Torn Paper
-writeHelper(romBytes, 0xC848B, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xC848B, hexHelper([
     "7F 01",    # Move the spawn point to the floor
     "F3 11",    # New coordinates: (383, 499, 64)
-])))
-writeHelper(romBytes, 0xDEF22, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xDEF22, hexHelper([
     "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
     "48 15 00", # 000C: Jump to 0015
-])))
+]))
 
 # Torn Paper: Slab
 # For these changes, see the modified "Slab" script above.
 
 # Scalpel
-writeHelper(romBytes, 0xDEE85, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDEE85, hexHelper([
     "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-])))
+]))
 
 # Slap Patch <-- "One-time dispenser" in morgue
 # Allow pickup of a single Slap Patch any time you have no slap
@@ -7412,7 +7170,7 @@ expandedOffset = scriptHelper(
 
 # Morgue Filing Cabinet helper script
 # Skip the text popups for the vanilla Tickets and Credstick
-writeHelper(romBytes, 0x1F292, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x1F292, hexHelper([
     "C0",       # 009B: Push zero
     "BE",       # 009C: Convert to boolean
     "BE",       # 009D: Convert to boolean
@@ -7430,21 +7188,21 @@ writeHelper(romBytes, 0x1F292, bytes.fromhex(' '.join([
     "BE",       # 00A9: Convert to boolean
     "BE",       # 00AA: Convert to boolean
     "BC",       # 00AB: Pop
-])))
+]))
 
 # Tickets
-writeHelper(romBytes, 0xDF139, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDF139, hexHelper([
     "52 1D 01", # 0003: Execute behaviour script 0x11D = New item-drawing script
-])))
+]))
 
 # Tickets: Filing Cabinet
 # Reveal the new item shuffled to this location
 romBytes[0x1F2CE:0x1F2CE+2] = romBytes[0xC8489:0xC8489+2]
 
 # Credstick
-writeHelper(romBytes, 0xDF077, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDF077, hexHelper([
     "52 1D 01", # 0003: Execute behaviour script 0x11D = New item-drawing script
-])))
+]))
 
 # Credstick: Filing Cabinet
 # Reveal the new item shuffled to this location
@@ -7453,7 +7211,7 @@ romBytes[0x1F2DE:0x1F2DE+2] = romBytes[0xC849B:0xC849B+2]
 # Wooden Door <-- In morgue main room, leading to morgue hallway
 # Change the behaviour script for the Wooden Door from 0xAD
 # (closed door) to 0xE2 (open door).
-struct.pack_into("<H", romBytes, 0x6B147, 0x00E2)
+uint16.pack_into(romBytes, 0x6B147, 0x00E2)
 # When the player-controllable Jake object is created at the beginning
 # of a new game, some code in [58 78] (Spawn hired shadowrunner) sets
 # the 0x0001 and 0x0002 bits of the Jake object's 7E1474+n entry.
@@ -7475,20 +7233,20 @@ romBytes[0x21F2] = 0x80 # <-- Was 0xD0
 # With this change, the Decker will no longer appear.
 # We do this to skip the Decker's automatic conversation.
 # Additionally, script 0x2C1 should now be entirely unused.
-struct.pack_into("<H", romBytes, 0x6C61D, 0x037B)
+uint16.pack_into(romBytes, 0x6C61D, 0x037B)
 # Tenth Street - West
 # Change the behaviour script for the Decker from 0x2C5 ("You can't be
 # alive!" guy in Tenth Street West) to 0x37B (do nothing).
 # With this change, the Decker will no longer appear.
 # We do this for consistency with the previous change.
 # Additionally, script 0x2C5 should now be entirely unused.
-struct.pack_into("<H", romBytes, 0x6C60F, 0x037B)
+uint16.pack_into(romBytes, 0x6C60F, 0x037B)
 
 # Dog Collar
-writeHelper(romBytes, 0xDF1BE, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDF1BE, hexHelper([
     "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
     "48 10 00", # 000C: Jump to 0010
-])))
+]))
 # Use facing direction 05's sprite for direction 00
 romBytes[0x649C4] = 0x08
 
@@ -7504,7 +7262,7 @@ romBytes[0xDCA5F:0xDCA5F+2] = romBytes[0xC817B:0xC817B+2]
 # in the caryards and then execute either script 0x6 (locked) or
 # script 0xAD (closed door) as appropriate.
 # With this change, script 0x37D should now be entirely unused.
-struct.pack_into("<H", romBytes, 0x6C0B3, 0x00E2)
+uint16.pack_into(romBytes, 0x6C0B3, 0x00E2)
 
 # Glass Door <-- Right door to Tenth Street monorail station
 # Open up the monorail early
@@ -7514,38 +7272,38 @@ struct.pack_into("<H", romBytes, 0x6C0B3, 0x00E2)
 # in the caryards and then execute either script 0x1DC (locked) or
 # script 0x2B4 (closed door) as appropriate.
 # With this change, script 0x1A6 should now be entirely unused.
-struct.pack_into("<H", romBytes, 0x6C0AC, 0x02E6)
+uint16.pack_into(romBytes, 0x6C0AC, 0x02E6)
 
 # Bulletin Board <-- Outside Tenth Street monorail station
 # We've opened up the monorail early, so let's update the bulletin
 # board to match. ("TENTH STREET STATION IS NOW FULLY REPAIRED")
-writeHelper(romBytes, 0xDF7A3, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDF7A3, hexHelper([
     "BC",       # 000F: Pop
     "C0",       # 0010: Push zero
     "BC",       # 0011: Pop
     "48 29 00", # 0012: Jump to 0029
-])))
+]))
 
 # Memo
-writeHelper(romBytes, 0xDF523, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDF523, hexHelper([
     "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-])))
+]))
 # Inventory list item-hiding
 # Don't hide the Memo after leaving Tenth Street
 romBytes[0x6B8DC] |= 0x3F
 
 # Door Key
-writeHelper(romBytes, 0xDF415, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDF415, hexHelper([
     "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
     "48 10 00", # 000C: Jump to 0010
-])))
+]))
 # Use facing direction 05's sprite for direction 00
 romBytes[0x6418C] = 0x08
 
 # Door Key: Seems familiar...
 # Skip the text popup for the vanilla Door Key
 # Reveal the new item shuffled to this location
-writeHelper(romBytes, 0xDD209, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDD209, hexHelper([
     "C0",       # 0046: Push zero
     "BE",       # 0047: Convert to boolean
     "BE",       # 0048: Convert to boolean
@@ -7569,19 +7327,19 @@ writeHelper(romBytes, 0xDD209, bytes.fromhex(' '.join([
     f"14 {romBytes[0xC93F3+0]:02X} {romBytes[0xC93F3+1]:02X}",
                 # 005D: Push short 0x#### <-- Object-id of new item in "Door Key" location
     "58 0D",    # 0060: Set bits of object's flags
-])))
+]))
 
 # Shades
-writeHelper(romBytes, 0xDF49D, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDF49D, hexHelper([
     "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-])))
+]))
 # Use facing direction 05's sprite for direction 00
 romBytes[0x642D6] = 0x08
 
 # Ripped Note
-writeHelper(romBytes, 0xDEFC3, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDEFC3, hexHelper([
     "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
-])))
+]))
 
 # Video Phone <-- In Jake's apartment
 # Change the behaviour script for the Video Phone from 0x1C6
@@ -7590,32 +7348,32 @@ writeHelper(romBytes, 0xDEFC3, bytes.fromhex(' '.join([
 # We're doing this so we don't have to listen to the recorded
 # message before using Jake's phone to make outgoing calls.
 # With this change, script 0x1C6 should now be entirely unused.
-struct.pack_into("<H", romBytes, 0x6B1A9, 0x0206)
+uint16.pack_into(romBytes, 0x6B1A9, 0x0206)
 
 # Beretta Pistol
-writeHelper(romBytes, 0xC886D, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xC886D, hexHelper([
     "34 01",    # Move the spawn point to waypoint 0x01 on the alley map
     "16 11",    # Waypoint 0x01 coordinates: (308, 278, 64)
-])))
+]))
 
 # Leather Jacket
-writeHelper(romBytes, 0xC8873, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xC8873, hexHelper([
     "5E 01",    # Move the spawn point to match the Orc's spawn point
     "4A 11",    # Orc's spawn coordinates: (350, 330, 64)
-])))
+]))
 # Change the behaviour script for the Leather Jacket from 0x354
 # (Leather Jacket in alley) to 0x292 (Leather Jacket).
 # In vanilla, 0x354 was a more complicated script to handle the
 # jacket in the alley, while 0x292 just specified armor stats
 # (with the former eventually invoking the latter).
 # With this change, script 0x354 should now be entirely unused.
-struct.pack_into("<H", romBytes, 0x6BB57, 0x0292)
+uint16.pack_into(romBytes, 0x6BB57, 0x0292)
 # Increase the Leather Jacket's sprite priority
 romBytes[0x6BB52] |= 0x40
 
 # Leather Jacket: Orc
 # Reveal the new item shuffled to this location
-writeHelper(romBytes, 0xDD15A, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDD15A, hexHelper([
     "00 01",    # 00C3: Push unsigned byte 0x01
     "02 01",    # 00C5: Push unsigned byte from $13+01 <-- Copy of original spawn index
     "58 33",    # 00C7: Set bits of object's flags
@@ -7662,51 +7420,51 @@ writeHelper(romBytes, 0xDD15A, bytes.fromhex(' '.join([
     "BC",       # 010B: Pop
     "52 8D 03", # 010C: Execute behaviour script 0x38D = Body behaviour script: "Nothing special here."
     "48 06 01", # 010F: Jump to 0106
-])))
+]))
 
 # Keyword: Dog
-writeHelper(romBytes, 0xC8855, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xC8855, hexHelper([
     "58 02",    # Move the spawn point a short distance down and right
     "2E 11",    # New coordinates: (600, 302, 64)
-])))
+]))
 
 # Paperweight
-writeHelper(romBytes, 0xDF5F4, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDF5F4, hexHelper([
     "C2",       # 0038: Push unsigned byte from $13+00 <-- Spawn index
     "52 1D 01", # 0039: Execute behaviour script 0x11D = New item-drawing script
     "00 00",    # 003C: Push unsigned byte 0x00
-])))
-writeHelper(romBytes, 0xDF608, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xDF608, hexHelper([
     "48 3C 00", # 004C: Jump to 003C
-])))
+]))
 
 # Cyberdeck
-writeHelper(romBytes, 0xFD0E4, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xFD0E4, hexHelper([
     "52 1D 01", # 0015: Execute behaviour script 0x11D = New item-drawing script
-])))
+]))
 # Use facing direction 05's sprite for direction 00
 romBytes[0x653AE] = 0x08
 
 # TODO: LoneStar Badge <-- Not currently subject to randomization
 
 # Iced Tea
-writeHelper(romBytes, 0xDF2D1, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDF2D1, hexHelper([
     "52 1D 01", # 0003: Execute behaviour script 0x11D = New item-drawing script
-])))
+]))
 
 # Iced Tea: Club Manager
 # Reveal the new item shuffled to this location
 romBytes[0x1E66C:0x1E66C+2] = romBytes[0xC87BF:0xC87BF+2]
 
 # Jamaican <-- Jangadance
-writeHelper(romBytes, 0xC879D, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xC879D, hexHelper([
     "08 02",    # Move the spawn point to waypoint 0x02 on the nightclub map
     "CC 11",    # Waypoint 0x02 coordinates: (520, 460, 64)
-])))
+]))
 # Skip the "on the phone" case
-writeHelper(romBytes, 0xDD3AE, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDD3AE, hexHelper([
     "44 54 00", # 000B: If false, jump to 0054
-])))
+]))
 
 # Video Phone <-- In the Grim Reaper Club
 # Change the behaviour script for the Video Phone from 0x2DF
@@ -7714,7 +7472,7 @@ writeHelper(romBytes, 0xDD3AE, bytes.fromhex(' '.join([
 # We're doing this because with NPC randomization, this phone
 # will not initially be in use by someone making a call.
 # With this change, script 0x2DF should now be entirely unused.
-struct.pack_into("<H", romBytes, 0x6B1A2, 0x0206)
+uint16.pack_into(romBytes, 0x6B1A2, 0x0206)
 
 # Ghoul Bone
 expandedOffset = scriptHelper(
@@ -7794,7 +7552,7 @@ romBytes[0x674F4] &= ~0x20
 # Ghoul Bone: Scary Ghoul
 # Increase the Scary Ghoul's item-drop chance from 50% to 100%
 # Reveal the new item shuffled to this location
-writeHelper(romBytes, 0x1FEDD, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x1FEDD, hexHelper([
     "0A FF",    # 00E5: Push signed byte 0xFF
     "BE",       # 00E7: Convert to boolean
     "BE",       # 00E8: Convert to boolean
@@ -7841,13 +7599,13 @@ writeHelper(romBytes, 0x1FEDD, bytes.fromhex(' '.join([
     "02 0A",    # 012B: Push unsigned byte from $13+0A <-- Item drop's spawn index
     "58 CE",    # 012D: Set bits of 7E1474+n <-- Makes the item drop subject to gravity
     "48 5C 01", # 012F: Jump to 015C
-])))
+]))
 
 # Magic Fetish
-writeHelper(romBytes, 0xC894D, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xC894D, hexHelper([
     "76 02",    # Move the spawn point to match Chrome Coyote's spawn point
     "A0 11",    # Chrome Coyote's spawn coordinates: (630, 416, 64)
-])))
+]))
 expandedOffset = scriptHelper(
     scriptNumber = 0x1BB,
     argsLen      = 0x02, # Script 0x1BB now takes 2 bytes (= 1 stack item) as arguments
@@ -7923,7 +7681,7 @@ expandedOffset = scriptHelper(
     ],
 )
 # Use the Talisman Case's sprite data (0xC1F4 --> 0xCFEC)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0x7F), 0xCFEC)
+uint16.pack_into(romBytes, 0x66D8A + (2 * 0x7F), 0xCFEC)
 
 # Magic Fetish: Indian Shaman <-- Chrome Coyote
 # Reveal the new item shuffled to this location
@@ -7937,13 +7695,13 @@ expandedOffset = scriptHelper(
     commandList  = [
         # 0000-0008
         # Copy 0000-0008 from the original script.
-        romBytes[0xDC3C2:0xDC3CB].hex(' '),
+        romBytes[0xDC3C2:0xDC3CB],
         # 0009-000B
         # Update jump destination (changed due to presence of new code).
         "46 67 00", # 0009: If true, jump to 0067
         # 000C-0066
         # Copy 000C-0066 from the original script.
-        romBytes[0xDC3CE:0xDC429].hex(' '),
+        romBytes[0xDC3CE:0xDC429],
         # 0067-00B2
         # New code.
         "00 05",    # 0067: Push unsigned byte 0x05
@@ -8002,15 +7760,15 @@ expandedOffset = scriptHelper(
 # to call" message, even if you know other phone numbers.
 # This isn't the desired behaviour, so let's make the script check
 # if there's anything in the "known phone numbers" list instead.
-writeHelper(romBytes, 0x16FD8, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x16FD8, hexHelper([
     "18 1C 3C", # 005E: Push short from $7E3C1C
-])))
+]))
 
 # Nuyen: Glutman
-writeHelper(romBytes, 0xC86D5, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xC86D5, hexHelper([
     "48 02",    # Move the spawn point a short distance up and right
     "14 12",    # New coordinates: (584, 532, 64)
-])))
+]))
 # Reveal the new item shuffled to this location
 romBytes[0x1FFF5:0x1FFF5+2] = romBytes[0xC86D9:0xC86D9+2]
 
@@ -8020,22 +7778,22 @@ romBytes[0x1FFF5:0x1FFF5+2] = romBytes[0xC86D9:0xC86D9+2]
 # "paid off" flag in "initialItemState", but it turns out that flag
 # also prevents you from fighting the King in the arena.
 # ("The King doesn't want to fight you...")
-writeHelper(romBytes, 0xE75CD, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xE75CD, hexHelper([
     "BC",       # 001C: Pop
     "C0",       # 001D: Push zero
     "BC",       # 001E: Pop
-])))
+]))
 
 # Arena owner
 # Skip the "defeated all ten fighters and the King" case.
 # In vanilla, defeating everyone replaces the arena owner conversation
 # with a text popup ("Buddy, nobody left to fight here!!"), which also
 # locks you out of buying the Negotiation skill.
-writeHelper(romBytes, 0xFB6C5, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xFB6C5, hexHelper([
     "C0",       # 0053: Push zero
     "BC",       # 0054: Pop
     "48 7B 00", # 0055: Jump to 007B
-])))
+]))
 
 # Potion Bottles
 expandedOffset = scriptHelper(
@@ -8236,7 +7994,7 @@ expandedOffset = scriptHelper(
     ],
 )
 # Use the Talisman Case's sprite data (0xD016 --> 0xCFEC)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xA5), 0xCFEC)
+uint16.pack_into(romBytes, 0x66D8A + (2 * 0xA5), 0xCFEC)
 
 # Potion Bottles: Talisman Case
 # Offer for sale the new item shuffled to this location
@@ -8363,7 +8121,7 @@ expandedOffset = scriptHelper(
     ],
 )
 # Use the Talisman Case's sprite data (0xD02A --> 0xCFEC)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0xA6), 0xCFEC)
+uint16.pack_into(romBytes, 0x66D8A + (2 * 0xA6), 0xCFEC)
 
 # Black Bottle: Talisman Case
 # Offer for sale the new item shuffled to this location
@@ -8505,7 +8263,7 @@ expandedOffset = scriptHelper(
     ],
 )
 # Use the Talisman Case's sprite data (0xCB9A --> 0xCFEC)
-struct.pack_into("<H", romBytes, 0x66D8A + (2 * 0x9B), 0xCFEC)
+uint16.pack_into(romBytes, 0x66D8A + (2 * 0x9B), 0xCFEC)
 
 # Stake: Talisman Case
 # Offer for sale the new item shuffled to this location
@@ -8515,56 +8273,56 @@ romBytes[0xE5DB5:0xE5DB5+2] = romBytes[0xC9707:0xC9707+2]
 # Offer for sale the new item shuffled to this location
 romBytes[0xE5F3B:0xE5F3B+2] = romBytes[0xC9649:0xC9649+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xE5F3E, equipmentPrices[struct.unpack_from("<H", romBytes, 0xC9649)[0]])
+uint16.pack_into(romBytes, 0xE5F3E, equipmentPrices[uint16.unpack_from(romBytes, 0xC9649)[0]])
 
 # Viper H. Pistol ($4,000): Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xE5F4D:0xE5F4D+2] = romBytes[0xC964F:0xC964F+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xE5F50, equipmentPrices[struct.unpack_from("<H", romBytes, 0xC964F)[0]])
+uint16.pack_into(romBytes, 0xE5F50, equipmentPrices[uint16.unpack_from(romBytes, 0xC964F)[0]])
 
 # Mesh Jacket ($5,000): Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xE5F5F:0xE5F5F+2] = romBytes[0xC9655:0xC9655+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xE5F62, equipmentPrices[struct.unpack_from("<H", romBytes, 0xC9655)[0]])
+uint16.pack_into(romBytes, 0xE5F62, equipmentPrices[uint16.unpack_from(romBytes, 0xC9655)[0]])
 
 # T-250 Shotgun ($15,000): Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xE5F71:0xE5F71+2] = romBytes[0xC965B:0xC965B+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xE5F74, equipmentPrices[struct.unpack_from("<H", romBytes, 0xC965B)[0]])
+uint16.pack_into(romBytes, 0xE5F74, equipmentPrices[uint16.unpack_from(romBytes, 0xC965B)[0]])
 
 # Fichetti L. Pistol: Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xE5F83:0xE5F83+2] = romBytes[0xC966D:0xC966D+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xE5F86, equipmentPrices[struct.unpack_from("<H", romBytes, 0xC966D)[0]])
+uint16.pack_into(romBytes, 0xE5F86, equipmentPrices[uint16.unpack_from(romBytes, 0xC966D)[0]])
 
 # Warhawk H. Pistol: Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xE5F95:0xE5F95+2] = romBytes[0xC9673:0xC9673+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xE5F98, equipmentPrices[struct.unpack_from("<H", romBytes, 0xC9673)[0]])
+uint16.pack_into(romBytes, 0xE5F98, equipmentPrices[uint16.unpack_from(romBytes, 0xC9673)[0]])
 
 # Glass doors <-- Left door at Oldtown monorail station
 # Change the behaviour script for the left glass door from 0x2B4
 # (closed door) to 0x37B (do nothing).
 # With this change, the glass door will no longer appear.
 # We do this to make the doorway easier to traverse.
-struct.pack_into("<H", romBytes, 0x6C0A5, 0x037B)
+uint16.pack_into(romBytes, 0x6C0A5, 0x037B)
 
 # Glass doors <-- Right door at Oldtown monorail station
 # Change the behaviour script for the right glass door from 0xAD
 # (closed door) to 0x37B (do nothing).
 # With this change, the glass door will no longer appear.
 # We do this to make the doorway easier to traverse.
-struct.pack_into("<H", romBytes, 0x6C09E, 0x037B)
+uint16.pack_into(romBytes, 0x6C09E, 0x037B)
 
 # Mono-Rail Car (Tenth Street to Oldtown) waypoints
-writeHelper(romBytes, 0xCA0DF, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xCA0DF, hexHelper([
     "2E 02",    # Change waypoint #4 (sliding doors) Y coordinate from 559 to 558
-])))
+]))
 
 # Mono-Rail Car (Tenth Street to Oldtown) driver car
 # Remove the arrival delay
@@ -8668,16 +8426,16 @@ expandedOffset = scriptHelper(
 )
 
 # Mono-Rail Car (Tenth Street to Oldtown) destination coordinates
-writeHelper(romBytes, 0x692AF + (9 * 0x95) + 3, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x692AF + (9 * 0x95) + 3, hexHelper([
     "65 01",    # Update the destination coordinates
     "F5 01",    # Old coordinates: (364, 518, 112)
     "70 00",    # New coordinates: (357, 501, 112)
-])))
+]))
 
 # Mono-Rail Car (Oldtown to Tenth Street) waypoints
-writeHelper(romBytes, 0xCA2A3, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xCA2A3, hexHelper([
     "2E 02",    # Change waypoint #4 (sliding doors) Y coordinate from 559 to 558
-])))
+]))
 
 # Mono-Rail Car (Oldtown to Tenth Street) driver car
 # Remove the arrival delay
@@ -8781,23 +8539,23 @@ expandedOffset = scriptHelper(
 )
 
 # Mono-Rail Car (Oldtown to Tenth Street) destination coordinates
-writeHelper(romBytes, 0x692AF + (9 * 0x8B) + 3, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x692AF + (9 * 0x8B) + 3, hexHelper([
     "65 01",    # Update the destination coordinates
     "F5 01",    # Old coordinates: (370, 512, 112)
     "70 00",    # New coordinates: (357, 501, 112)
-])))
+]))
 
 # Mono-Rail Car (Oldtown to Downtown) waypoints
-writeHelper(romBytes, 0xD1C57, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xD1C57, hexHelper([
     "BD 01",    # Change waypoint #3 (driver car) Y coordinate from 435 to 445
-])))
-writeHelper(romBytes, 0xD1C5D, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xD1C5D, hexHelper([
     "9A 01",    # Change waypoint #4 (passenger car) Y coordinate from 400 to 410
-])))
-writeHelper(romBytes, 0xD1C61, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xD1C61, hexHelper([
     "04 02",    # Change waypoint #5 (sliding doors) X coordinate from 517 to 516
     "A6 01",    # Change waypoint #5 (sliding doors) Y coordinate from 412 to 422
-])))
+]))
 
 # Mono-Rail Car (Oldtown to Downtown) driver car
 # Remove the arrival delay
@@ -8901,23 +8659,23 @@ expandedOffset = scriptHelper(
 )
 
 # Mono-Rail Car (Oldtown to Downtown) destination coordinates
-writeHelper(romBytes, 0x692AF + (9 * 0x20) + 3, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x692AF + (9 * 0x20) + 3, hexHelper([
     "B8 01",    # Update the destination coordinates
     "B8 01",    # Old coordinates: (448, 432,  64)
     "40 00",    # New coordinates: (440, 440,  64)
-])))
+]))
 
 # Mono-Rail Car (Downtown to Oldtown) waypoints
-writeHelper(romBytes, 0xCA789, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xCA789, hexHelper([
     "EF 01",    # Change waypoint #3 (driver car) Y coordinate from 485 to 495
-])))
-writeHelper(romBytes, 0xCA78F, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xCA78F, hexHelper([
     "CC 01",    # Change waypoint #4 (passenger car) Y coordinate from 450 to 460
-])))
-writeHelper(romBytes, 0xCA793, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xCA793, hexHelper([
     "16 02",    # Change waypoint #5 (sliding doors) X coordinate from 535 to 534
     "D8 01",    # Change waypoint #5 (sliding doors) Y coordinate from 462 to 472
-])))
+]))
 
 # Mono-Rail Car (Downtown to Oldtown) driver car
 # Remove the arrival delay
@@ -9021,28 +8779,28 @@ expandedOffset = scriptHelper(
 )
 
 # Mono-Rail Car (Downtown to Oldtown) destination coordinates
-writeHelper(romBytes, 0x692AF + (9 * 0x18D) + 3, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x692AF + (9 * 0x18D) + 3, hexHelper([
     "C1 01",    # Update the destination coordinates
     "91 01",    # Old coordinates: (462, 396, 104)
     "68 00",    # New coordinates: (449, 401, 104)
-])))
+]))
 
 # Iron Key
-writeHelper(romBytes, 0xCA7B5, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xCA7B5, hexHelper([
     "6F 02",    # Move the spawn point to slightly below the Ferocious Orc
     "1C 1A",    # New coordinates: (623, 540, 96)
-])))
-writeHelper(romBytes, 0xF448C, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF448C, hexHelper([
     "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
     "48 12 00", # 000C: Jump to 0012
-])))
+]))
 # Use facing direction 05's sprite for direction 00
 romBytes[0x65F10] = 0x08
 
 # Iron Key: Ferocious Orc
 # Skip the automatic conversation after defeating the Ferocious Orc
 # Reveal the new item shuffled to this location
-writeHelper(romBytes, 0xF905F, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF905F, hexHelper([
     "C0",       # 0006: Push zero
     "BE",       # 0007: Convert to boolean
     "BE",       # 0008: Convert to boolean
@@ -9052,7 +8810,7 @@ writeHelper(romBytes, 0xF905F, bytes.fromhex(' '.join([
     f"14 {romBytes[0xCA7B9+0]:02X} {romBytes[0xCA7B9+1]:02X}",
                 # 000D: Push short 0x#### <-- Object-id of new item in "Iron Key" location
     "58 0D",    # 0010: Set bits of object's flags
-])))
+]))
 
 # Doggie <-- Daley Station
 # Change the behaviour script for the Doggie from 0x1F8 (Doggie at
@@ -9060,7 +8818,7 @@ writeHelper(romBytes, 0xF905F, bytes.fromhex(' '.join([
 # With this change, the Doggie will no longer appear.
 # We do this to skip the Doggie's automatic conversation.
 # Additionally, script 0x1F8 should now be entirely unused.
-struct.pack_into("<H", romBytes, 0x6C559, 0x037B)
+uint16.pack_into(romBytes, 0x6C559, 0x037B)
 
 # Doorway from Maplethorpe Plaza into Maplethorpe's waiting room
 # Enlarge the doorway warp zone to make it easier to traverse
@@ -9084,23 +8842,23 @@ romBytes[0xF69AD] = 0x04 # Keyword-id for "Bremerton"
 
 # Heavy Dude <-- Guarding entrance to Rust Stiletto turf
 # Skip the automatic conversation when entering Rust Stiletto turf
-writeHelper(romBytes, 0xF9143, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF9143, hexHelper([
     "C0",       # 0012: Push zero
     "BE",       # 0013: Convert to boolean
     "BE",       # 0014: Convert to boolean
     "BE",       # 0015: Convert to boolean
     "BE",       # 0016: Convert to boolean
     "BC",       # 0017: Pop
-])))
+]))
 
 # Crowbar
-writeHelper(romBytes, 0xD0823, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xD0823, hexHelper([
     "70 01",    # Move the spawn point to slightly below the Ferocious Orc's waypoint
     "B3 11",    # New coordinates: (368, 435, 64)
-])))
-writeHelper(romBytes, 0xF4320, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF4320, hexHelper([
     "52 1D 01", # 0003: Execute behaviour script 0x11D = New item-drawing script
-])))
+]))
 # Increase the Crowbar's sprite priority
 romBytes[0x6C6B9] |= 0x40
 # Inventory list item-hiding
@@ -9121,7 +8879,7 @@ expandedOffset = scriptHelper(
     maxStackLen  = 0x0E, # Header byte: Maximum stack height of 0x0E bytes (= 7 stack items)
     commandList  = [
         # Copy 0000-0062 from the original script.
-        romBytes[0xF9087:0xF90EA].hex(' '),
+        romBytes[0xF9087:0xF90EA],
         # New code.
         # Nuyen: Gang Leader
         # Reveal the new item shuffled to this location
@@ -9130,7 +8888,7 @@ expandedOffset = scriptHelper(
                     # 0065: Push short 0x#### <-- Object-id of new item in "Nuyen: Gang Leader" location
         "58 0D",    # 0068: Set bits of object's flags
         # Silently award the boss bounty
-        f"""14 {struct.pack("<H", bossBounties["Gang Leader"]).hex(' ')}""",
+        f"""14 {uint16.pack(bossBounties["Gang Leader"]).hex(' ')}""",
                     # 006A: Push short 0x#### <-- Boss bounty
         "58 98",    # 006D: Increase nuyen
         # If Jetboy is in the party, silently award the Jetboy bonus
@@ -9187,7 +8945,7 @@ expandedOffset = scriptHelper(
         "58 0E",    # 00B2: Set window's text cursor position <-- Repurposed function!
         # Print bounty amount
         "C0",       # 00B4: Push zero
-        f"""14 {struct.pack("<H", bossBounties["Gang Leader"]).hex(' ')}""",
+        f"""14 {uint16.pack(bossBounties["Gang Leader"]).hex(' ')}""",
                     # 00B5: Push short 0x#### <-- Boss bounty
         "02 04",    # 00B8: Push unsigned byte from $13+04 <-- Text-window-slot number
         "58 04",    # 00BA: Print nuyen amount to window
@@ -9214,32 +8972,32 @@ expandedOffset = scriptHelper(
 )
 
 # Nuyen: Gang Leader
-writeHelper(romBytes, 0xD08E9, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xD08E9, hexHelper([
     "E3 02",    # Move the spawn point to slightly below the Gang Leader
     "FE 11",    # New coordinates: (739, 510, 64)
-])))
+]))
 
 # Cruel man <-- Left bouncer at the entrance to Jagged Nails
 # Allow access to Jagged Nails without having to defeat the Rust Stilettos
 # Force the "always room for a true shadowrunner" conversation
-writeHelper(romBytes, 0xF628E, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF628E, hexHelper([
     "BE",       # 0018: Convert to boolean
     "BC",       # 0019: Pop
     "48 1D 00", # 001A: Jump to 001D
-])))
+]))
 # Truncate the "handled that Stilettos gang mighty fine" text
 romBytes[0xE9950] = 0xB8
 romBytes[0xE9951] = 0x80
 
 # Kitsune
-writeHelper(romBytes, 0xCB797, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xCB797, hexHelper([
     "3E 01",    # Move the spawn point to waypoint 0x04 on the nightclub map
     "9A 11",    # Waypoint 0x04 coordinates: (318, 410, 64)
-])))
+]))
 # Skip over the code for Kitsune's on-stage behaviour
-writeHelper(romBytes, 0xF6317, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF6317, hexHelper([
     "48 80 01", # 0002: Jump to 0180
-])))
+]))
 
 # TODO: Leaves <-- Not currently subject to randomization
 
@@ -9249,15 +9007,15 @@ writeHelper(romBytes, 0xF6317, bytes.fromhex(' '.join([
 romBytes[0x6B2DF] |= 0x3F
 
 # Explosives
-writeHelper(romBytes, 0xCA609, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xCA609, hexHelper([
     "E1 81",    # Move the spawn point to slightly below the Massive Orc
     "F4 19",    # New coordinates: (481, 500, 112)
-])))
-writeHelper(romBytes, 0xF4173, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF4173, hexHelper([
     "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
     "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
     "48 25 00", # 000C: Jump to 0025
-])))
+]))
 # Inventory list item-hiding
 # Don't hide the Explosives after taking the helicopter to Drake Volcano
 romBytes[0x6C3D3] |= 0x3F
@@ -9270,26 +9028,26 @@ romBytes[0x675BA] &= ~0x20
 # Previously, the Massive Orc appeared after learning "Bremerton".
 # This worked, but if you learned "Bremerton" early, it made getting
 # the "Docks" keyword from the taxiboat driver difficult.
-writeHelper(romBytes, 0xFA9EC, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xFA9EC, hexHelper([
     "14 0E 1C", # 0002: Push short 0x1C0E <-- Object-id of ice delivery guy at Wastelands
     "58 BA",    # 0005: Push object's flags
     "00 02",    # 0007: Push unsigned byte 0x02
     "7E",       # 0009: Bitwise AND
     "BE",       # 000A: Convert to boolean
-])))
+]))
 # Reveal the new item shuffled to this location
-writeHelper(romBytes, 0xFAA53, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xFAA53, hexHelper([
     "00 80",    # 0069: Push unsigned byte 0x80
     f"14 {romBytes[0xCA60D+0]:02X} {romBytes[0xCA60D+1]:02X}",
                 # 006B: Push short 0x#### <-- Object-id of new item in "Explosives" location
-])))
+]))
 
 # Mermaid Scales
-writeHelper(romBytes, 0xF49B1, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF49B1, hexHelper([
     "C2",       # 0008: Push unsigned byte from $13+00 <-- Spawn index
     "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
     "48 20 00", # 000C: Jump to 0020
-])))
+]))
 
 # Mermaid Scales: A Busy Man <-- Ice delivery guy at Wastelands
 # Reveal the new item shuffled to this location
@@ -9327,7 +9085,7 @@ expandedOffset = scriptHelper(
     maxStackLen  = 0x0E, # Header byte: Maximum stack height of 0x0E bytes (= 7 stack items)
     commandList  = [
         # Copy 0000-00AD from the original script.
-        romBytes[0xF86F6:0xF87A4].hex(' '),
+        romBytes[0xF86F6:0xF87A4],
         # New code.
         # Nuyen: Octopus
         # Reveal the new item shuffled to this location
@@ -9340,7 +9098,7 @@ expandedOffset = scriptHelper(
         "14 66 06", # 00B7: Push short 0x0666 <-- Object-id of "Pool of Ink"
         "58 0D",    # 00BA: Set bits of object's flags
         # Silently award the boss bounty
-        f"""14 {struct.pack("<H", bossBounties["Octopus"]).hex(' ')}""",
+        f"""14 {uint16.pack(bossBounties["Octopus"]).hex(' ')}""",
                     # 00BC: Push short 0x#### <-- Boss bounty
         "58 98",    # 00BF: Increase nuyen
         # Perish
@@ -9375,7 +9133,7 @@ expandedOffset = scriptHelper(
         "58 0E",    # 00F0: Set window's text cursor position <-- Repurposed function!
         # Print bounty amount
         "C0",       # 00F2: Push zero
-        f"""14 {struct.pack("<H", bossBounties["Octopus"]).hex(' ')}""",
+        f"""14 {uint16.pack(bossBounties["Octopus"]).hex(' ')}""",
                     # 00F3: Push short 0x#### <-- Boss bounty
         "02 04",    # 00F6: Push unsigned byte from $13+04 <-- Text-window-slot number
         "58 04",    # 00F8: Print nuyen amount to window
@@ -9401,7 +9159,7 @@ expandedOffset = scriptHelper(
     maxStackLen  = 0x0E, # Header byte: Maximum stack height of 0x0E bytes (= 7 stack items)
     commandList  = [
         # Copy 0000-0178 from the original script.
-        romBytes[0xF4CC7:0xF4E40].hex(' '),
+        romBytes[0xF4CC7:0xF4E40],
         # New code.
         # Keyword: Jester Spirit
         # Reveal the new item shuffled to this location
@@ -9458,7 +9216,7 @@ expandedOffset = scriptHelper(
         "02 0E",    # 01CD: Push unsigned byte from $13+0E <-- Item drop's spawn index
         "58 33",    # 01CF: Set bits of object's flags
         # Silently award the boss bounty
-        f"""14 {struct.pack("<H", bossBounties["Rat Shaman"]).hex(' ')}""",
+        f"""14 {uint16.pack(bossBounties["Rat Shaman"]).hex(' ')}""",
                     # 01D1: Push short 0x#### <-- Boss bounty
         "58 98",    # 01D4: Increase nuyen
         # Set the Dog Spirit's 0x01 flag ("Rat Shaman defeated")
@@ -9525,7 +9283,7 @@ expandedOffset = scriptHelper(
         "58 0E",    # 0233: Set window's text cursor position <-- Repurposed function!
         # Print bounty amount
         "C0",       # 0235: Push zero
-        f"""14 {struct.pack("<H", bossBounties["Rat Shaman"]).hex(' ')}""",
+        f"""14 {uint16.pack(bossBounties["Rat Shaman"]).hex(' ')}""",
                     # 0236: Push short 0x#### <-- Boss bounty
         "02 0F",    # 0239: Push unsigned byte from $13+0F <-- Text-window-slot number
         "58 04",    # 023B: Print nuyen amount to window
@@ -9539,14 +9297,14 @@ expandedOffset = scriptHelper(
 )
 # Skip the automatic conversations with the Jester Spirit and Kitsune
 # that happen after you defeat the Rat Shaman
-writeHelper(romBytes, 0xF4EF2, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF4EF2, hexHelper([
     "BC",       # 0022: Pop
     "BC",       # 0023: Pop
-])))
-writeHelper(romBytes, 0xF4F3E, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF4F3E, hexHelper([
     "BC",       # 006E: Pop
     "BC",       # 006F: Pop
-])))
+]))
 
 # Bronze Gate to Dark Blade courtyard
 # Set the gate's 0x01 flag, so it starts out already open
@@ -9562,7 +9320,7 @@ romBytes[0x17B9B] = 0x02 # <-- Was 0x01
 
 # Door from Dark Blade courtyard into Dark Blade mansion interior
 # Convert the door into a proximity-triggered behaviour script
-writeHelper(romBytes, 0xD104A, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xD104A, hexHelper([
     # D104A: 0x01 proximity-triggered behaviour scripts (was 0x00)
     "01",
     # D104B: Replacement for vanilla door to "Dark Blade - Main Hall"
@@ -9581,7 +9339,7 @@ writeHelper(romBytes, 0xD104A, bytes.fromhex(' '.join([
     "44 02 8C 01 40 00 4B 02 BF 01 83 00 C0 00",
     # D1068: Vanilla door to "Dark Blade - Gun Shop"
     "AB 00 36 02 40 00 EA 00 47 02 5F 00 7C 01",
-])))
+]))
 # New proximity-triggered behaviour
 # We're using behaviour script 0x342, which is Vladimir in vanilla.
 # Since we've replaced Vladimir with the "Bremerton" keyword-item,
@@ -9625,55 +9383,55 @@ expandedOffset = scriptHelper(
 # Offer for sale the new item shuffled to this location
 romBytes[0xFCE76:0xFCE76+2] = romBytes[0xD1715:0xD1715+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xFCE79, equipmentPrices[struct.unpack_from("<H", romBytes, 0xD1715)[0]])
+uint16.pack_into(romBytes, 0xFCE79, equipmentPrices[uint16.unpack_from(romBytes, 0xD1715)[0]])
 
 # T-250 Shotgun ($12,000): Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xFCE88:0xFCE88+2] = romBytes[0xD171B:0xD171B+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xFCE8B, equipmentPrices[struct.unpack_from("<H", romBytes, 0xD171B)[0]])
+uint16.pack_into(romBytes, 0xFCE8B, equipmentPrices[uint16.unpack_from(romBytes, 0xD171B)[0]])
 
 # Uzi III SMG: Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xFCE9A:0xFCE9A+2] = romBytes[0xD1721:0xD1721+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xFCE9D, equipmentPrices[struct.unpack_from("<H", romBytes, 0xD1721)[0]])
+uint16.pack_into(romBytes, 0xFCE9D, equipmentPrices[uint16.unpack_from(romBytes, 0xD1721)[0]])
 
 # HK 277 A. Rifle: Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xFCEAC:0xFCEAC+2] = romBytes[0xD1727:0xD1727+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xFCEAF, equipmentPrices[struct.unpack_from("<H", romBytes, 0xD1727)[0]])
+uint16.pack_into(romBytes, 0xFCEAF, equipmentPrices[uint16.unpack_from(romBytes, 0xD1727)[0]])
 
 # Bulletproof Vest: Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xFCED0:0xFCED0+2] = romBytes[0xD172D:0xD172D+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xFCED3, equipmentPrices[struct.unpack_from("<H", romBytes, 0xD172D)[0]])
+uint16.pack_into(romBytes, 0xFCED3, equipmentPrices[uint16.unpack_from(romBytes, 0xD172D)[0]])
 
 # Concealed Jacket: Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xFCEE2:0xFCEE2+2] = romBytes[0xD1733:0xD1733+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xFCEE5, equipmentPrices[struct.unpack_from("<H", romBytes, 0xD1733)[0]])
+uint16.pack_into(romBytes, 0xFCEE5, equipmentPrices[uint16.unpack_from(romBytes, 0xD1733)[0]])
 
 # Partial Bodysuit: Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xFCEF4:0xFCEF4+2] = romBytes[0xD1739:0xD1739+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xFCEF7, equipmentPrices[struct.unpack_from("<H", romBytes, 0xD1739)[0]])
+uint16.pack_into(romBytes, 0xFCEF7, equipmentPrices[uint16.unpack_from(romBytes, 0xD1739)[0]])
 
 # Full Bodysuit: Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xFCF06:0xFCF06+2] = romBytes[0xD1745:0xD1745+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xFCF09, equipmentPrices[struct.unpack_from("<H", romBytes, 0xD1745)[0]])
+uint16.pack_into(romBytes, 0xFCF09, equipmentPrices[uint16.unpack_from(romBytes, 0xD1745)[0]])
 
 # AS-7 A. Cannon: Gun Case
 # Offer for sale the new item shuffled to this location
 romBytes[0xFCF18:0xFCF18+2] = romBytes[0xD174B:0xD174B+2]
 # Set the case's price to match the new case contents
-struct.pack_into("<H", romBytes, 0xFCF1B, equipmentPrices[struct.unpack_from("<H", romBytes, 0xD174B)[0]])
+uint16.pack_into(romBytes, 0xFCF1B, equipmentPrices[uint16.unpack_from(romBytes, 0xD174B)[0]])
 
 # Dark Blade mansion security status
 # Start with the mansion security on alert
@@ -9681,24 +9439,24 @@ initialItemState[0x83F] |= 0x40
 
 # Mage <-- In the front hall of the Dark Blade mansion
 # Don't disappear when you know the "Laughlyn" keyword
-writeHelper(romBytes, 0xF36E4, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF36E4, hexHelper([
     "C0",       # 003E: Push zero
     "BC",       # 003F: Pop
     "C0",       # 0040: Push zero
     "BC",       # 0041: Pop
     "48 4C 00", # 0042: Jump to 004C
-])))
+]))
 
 # Bronze Key
-writeHelper(romBytes, 0xF4512, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF4512, hexHelper([
     "48 0E 00", # 0002: Jump to 000E
-])))
-writeHelper(romBytes, 0xF4524, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF4524, hexHelper([
     "C2",       # 0014: Push unsigned byte from $13+00 <-- Spawn index
     "52 1D 01", # 0015: Execute behaviour script 0x11D = New item-drawing script
     "C0",       # 0018: Push zero
     "BC",       # 0019: Pop
-])))
+]))
 # Use facing direction 05's sprite for direction 00
 romBytes[0x65EFC] = 0x08
 # Inventory list item-hiding
@@ -9711,7 +9469,7 @@ romBytes[0x6C921] |= 0x3F
 # In vanilla, 0x388 was a more complicated script to handle the
 # jacket in the mansion, while 0x1A8 just specified armor stats.
 # With this change, script 0x388 should now be entirely unused.
-struct.pack_into("<H", romBytes, 0x6B894, 0x01A8)
+uint16.pack_into(romBytes, 0x6B894, 0x01A8)
 # Increase the free Mesh Jacket's sprite priority
 romBytes[0x6B88F] |= 0x40
 
@@ -9842,7 +9600,7 @@ expandedOffset = scriptHelper(
     maxStackLen  = 0x0E, # Header byte: Maximum stack height of 0x0E bytes (= 7 stack items)
     commandList  = [
         # Copy 0000-003A from the original script.
-        romBytes[0xF3B4F:0xF3B8A].hex(' '),
+        romBytes[0xF3B4F:0xF3B8A],
         # Spawn the Vampire if the game has been completed (in-credits
         # Vampire case), or if the Vampire hasn't been defeated yet.
         "00 2C",    # 003B: Push unsigned byte 0x2C
@@ -9859,7 +9617,7 @@ expandedOffset = scriptHelper(
         "56",       # 004E: End
         # VAMPIRE_NOT_DEFEATED_YET
         # Copy 004F-0121 from the original script.
-        romBytes[0xF3B9E:0xF3C71].hex(' '),
+        romBytes[0xF3B9E:0xF3C71],
         # VAMPIRE_STAKED_ONCE
         # New Vampire behaviour:
         # - No conversations
@@ -9919,7 +9677,7 @@ expandedOffset = scriptHelper(
         "02 07",    # 0170: Push unsigned byte from $13+07 <-- Item drop's spawn index
         "58 33",    # 0172: Set bits of object's flags
         # Silently award the boss bounty
-        f"""14 {struct.pack("<H", bossBounties["Vampire"]).hex(' ')}""",
+        f"""14 {uint16.pack(bossBounties["Vampire"]).hex(' ')}""",
                     # 0174: Push short 0x#### <-- Boss bounty
         "58 98",    # 0177: Increase nuyen
         # Death animation
@@ -9965,7 +9723,7 @@ expandedOffset = scriptHelper(
         "58 0E",    # 01B8: Set window's text cursor position <-- Repurposed function!
         # Print bounty amount
         "C0",       # 01BA: Push zero
-        f"""14 {struct.pack("<H", bossBounties["Vampire"]).hex(' ')}""",
+        f"""14 {uint16.pack(bossBounties["Vampire"]).hex(' ')}""",
                     # 01BB: Push short 0x#### <-- Boss bounty
         "02 08",    # 01BE: Push unsigned byte from $13+08 <-- Text-window-slot number
         "58 04",    # 01C0: Print nuyen amount to window
@@ -9984,7 +9742,7 @@ expandedOffset = scriptHelper(
     commandList  = [
         # 0000-0050
         # Copy 0000-0050 from the original script.
-        romBytes[0xF3E1F:0xF3E70].hex(' '),
+        romBytes[0xF3E1F:0xF3E70],
         # 0051-0069
         # Spawn the ghouls if the game has been completed (in-credits
         # Vampire case).
@@ -10015,7 +9773,7 @@ expandedOffset = scriptHelper(
         # VAMPIRE_NOT_DEFEATED_YET
         # 0073-008D
         # Copy 0051-006B from the original script.
-        romBytes[0xF3E70:0xF3E8B].hex(' '),
+        romBytes[0xF3E70:0xF3E8B],
         # ------------------------------------------------------------
         # We're skipping 006C-0071 from the original script here.
         # The skipped bytes zero out the Vampire's flags, probably
@@ -10024,57 +9782,57 @@ expandedOffset = scriptHelper(
         # ------------------------------------------------------------
         # 008E-0096
         # Copy 0072-007A from the original script.
-        romBytes[0xF3E91:0xF3E9A].hex(' '),
+        romBytes[0xF3E91:0xF3E9A],
         # 0097-0099
         # Update jump destination (changed due to presence of new code).
         "44 A1 00", # 0097: If false, jump to 00A1
         # 009A-009D
         # Copy 007E-0081 from the original script.
-        romBytes[0xF3E9D:0xF3EA1].hex(' '),
+        romBytes[0xF3E9D:0xF3EA1],
         # 009E-00A0
         # Update jump destination (changed due to presence of new code).
         "48 2F 01", # 009E: Jump to 012F
         # 00A1-00A9
         # Copy 0085-008D from the original script.
-        romBytes[0xF3EA4:0xF3EAD].hex(' '),
+        romBytes[0xF3EA4:0xF3EAD],
         # 00AA-00AC
         # Update jump destination (changed due to presence of new code).
         "44 1B 01", # 00AA: If false, jump to 011B
         # 00AD-00D2
         # Copy 0091-00B6 from the original script.
-        romBytes[0xF3EB0:0xF3ED6].hex(' '),
+        romBytes[0xF3EB0:0xF3ED6],
         # 00D3-00D5
         # Update jump destination (changed due to presence of new code).
         "46 1B 01", # 00D3: If true, jump to 011B
         # 00D6-00EF
         # Copy 00BA-00D3 from the original script.
-        romBytes[0xF3ED9:0xF3EF3].hex(' '),
+        romBytes[0xF3ED9:0xF3EF3],
         # 00F0-00F2
         # Update jump destination (changed due to presence of new code).
         "44 1B 01", # 00F0: If false, jump to 011B
         # 00F3-013A
         # Copy 00D7-011E from the original script.
-        romBytes[0xF3EF6:0xF3F3E].hex(' '),
+        romBytes[0xF3EF6:0xF3F3E],
         # 013B-013D
         # Update jump destination (changed due to presence of new code).
         "44 8E 00", # 013B: If false, jump to 008E
         # 013E-0146
         # Copy 0122-012A from the original script.
-        romBytes[0xF3F41:0xF3F4A].hex(' '),
+        romBytes[0xF3F41:0xF3F4A],
         # 0147-0149
         # Update jump destination (changed due to presence of new code).
         "46 52 01", # 0147: If true, jump to 0152
         # 014A-0158
         # Copy 012E-013C from the original script.
-        romBytes[0xF3F4D:0xF3F5C].hex(' '),
+        romBytes[0xF3F4D:0xF3F5C],
     ],
 )
 
 # Dog Tag
-writeHelper(romBytes, 0xC9C75, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xC9C75, hexHelper([
     "8F 21",    # Move the spawn point to match the Doggie's spawn point
     "6C 22",    # Doggie's spawn coordinates: (399, 620, 132)
-])))
+]))
 expandedOffset = scriptHelper(
     scriptNumber = 0x304,
     argsLen      = 0x02, # Script 0x304 now takes 2 bytes (= 1 stack item) as arguments
@@ -10151,7 +9909,7 @@ expandedOffset = scriptHelper(
     maxStackLen  = 0x0C, # Header byte: Maximum stack height of 0x0C bytes (= 6 stack items)
     commandList  = [
         # Copy 0000-0015 from the original script.
-        romBytes[0xF512A:0xF5140].hex(' '),
+        romBytes[0xF512A:0xF5140],
         # New code.
         f"14 {romBytes[0xC9C79+0]:02X} {romBytes[0xC9C79+1]:02X}",
                     # 0016: Push short 0x####   <-- Item drop's object-id
@@ -10159,7 +9917,7 @@ expandedOffset = scriptHelper(
         "00 80",    # 001B: Push unsigned byte 0x80
         "7E",       # 001D: Bitwise AND
         # Copy 001E-00E7 from the original script.
-        romBytes[0xF5148:0xF5212].hex(' '),
+        romBytes[0xF5148:0xF5212],
         # More new code.
         f"14 {romBytes[0xC9C79+0]:02X} {romBytes[0xC9C79+1]:02X}",
                     # 00E8: Push short 0x####   <-- Item drop's object-id
@@ -10208,7 +9966,7 @@ expandedOffset = scriptHelper(
     maxStackLen  = 0x0E, # Header byte: Maximum stack height of 0x0E bytes (= 7 stack items)
     commandList  = [
         # Copy 0000-00BC from the original script.
-        romBytes[0xF5815:0xF58D2].hex(' '),
+        romBytes[0xF5815:0xF58D2],
         # New code.
         # CHECK_IF_SAFE_I_IS_UNLOCKED
         "C2",       # 00BD: Push unsigned byte from $13+00 <-- Spawn index
@@ -10263,10 +10021,10 @@ expandedOffset = scriptHelper(
 )
 
 # Safe Key
-writeHelper(romBytes, 0xF4618, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF4618, hexHelper([
     "52 1D 01", # 0009: Execute behaviour script 0x11D = New item-drawing script
     "48 12 00", # 000C: Jump to 0012
-])))
+]))
 # Use facing direction 05's sprite for direction 00
 romBytes[0x66850] = 0x08
 
@@ -10275,11 +10033,11 @@ romBytes[0x66850] = 0x08
 romBytes[0xF580E:0xF580E+2] = romBytes[0xD2315:0xD2315+2]
 
 # Detonator
-writeHelper(romBytes, 0xD230B, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xD230B, hexHelper([
     "44 02",    # Move the spawn point to the floor outside the safe
     "96 11",    # New coordinates: (580, 406, 64)
-])))
-writeHelper(romBytes, 0xF40C2, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF40C2, hexHelper([
     "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
     "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
     "58 C5",    # 0003: Check if object has an owner
@@ -10291,17 +10049,17 @@ writeHelper(romBytes, 0xF40C2, bytes.fromhex(' '.join([
     "58 C5",    # 000D: Check if object has an owner
     "2C 01",    # 000F: Pop byte to $13+01 <-- Whether object has an owner
     "00 00",    # 0011: Push unsigned byte 0x00
-])))
-writeHelper(romBytes, 0xF410F, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF410F, hexHelper([
     "44 0C 00", # 004D: If not owned, jump to TOP_OF_LOOP
-])))
+]))
 
 # Broken Bottle
-writeHelper(romBytes, 0xD231D, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xD231D, hexHelper([
     "46 02",    # Move the spawn point to the floor outside the safe
     "B4 11",    # New coordinates: (582, 436, 64)
-])))
-writeHelper(romBytes, 0xF4118, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF4118, hexHelper([
     "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
     "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
     "58 C5",    # 0003: Check if object has an owner
@@ -10313,17 +10071,17 @@ writeHelper(romBytes, 0xF4118, bytes.fromhex(' '.join([
     "58 C5",    # 000D: Check if object has an owner
     "2C 01",    # 000F: Pop byte to $13+01 <-- Whether object has an owner
     "00 00",    # 0011: Push unsigned byte 0x00
-])))
-writeHelper(romBytes, 0xF4162, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF4162, hexHelper([
     "44 0C 00", # 004A: If not owned, jump to TOP_OF_LOOP
-])))
+]))
 
 # Green Bottle
-writeHelper(romBytes, 0xD24E5, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xD24E5, hexHelper([
     "45 02",    # Move the spawn point to the floor outside the safe
     "97 11",    # New coordinates: (581, 407, 64)
-])))
-writeHelper(romBytes, 0xF428E, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF428E, hexHelper([
     "2C 00",    # 0000: Pop byte to $13+00 <-- Spawn index
     "C2",       # 0002: Push unsigned byte from $13+00 <-- Spawn index
     "58 C5",    # 0003: Check if object has an owner
@@ -10341,10 +10099,10 @@ writeHelper(romBytes, 0xF428E, bytes.fromhex(' '.join([
     "34 02",    # 001A: Pop short to $13+02 <-- Selected menu option
     # CHECK_IF_EXAMINE
     "14 80 00", # 001C: Push short 0x0080
-])))
-writeHelper(romBytes, 0xF4314, bytes.fromhex(' '.join([
+]))
+writeHelper(romBytes, 0xF4314, hexHelper([
     "44 0C 00", # 0086: If not owned, jump to TOP_OF_LOOP
-])))
+]))
 
 # Jester Spirit (boss)
 expandedOffset = scriptHelper(
@@ -10363,17 +10121,17 @@ expandedOffset = scriptHelper(
         "BC",       # 0005: Pop
         # 0006-00FE
         # Copy 0006-00FE from the original script.
-        romBytes[0xDE041:0xDE13A].hex(' '),
+        romBytes[0xDE041:0xDE13A],
         # 00FF-0100
         # Move the defeated Jester Spirit a bit more to the lower left.
         "00 18",    # 00FF: Push unsigned byte 0x18
         # 0101-0132
         # Copy 0101-0132 from the original script.
-        romBytes[0xDE13C:0xDE16E].hex(' '),
+        romBytes[0xDE13C:0xDE16E],
         # Skip the vanilla code that handles the post-defeat conversation.
         # 0133-017D
         # Copy 0157-01A1 from the original script.
-        romBytes[0xDE192:0xDE1DD].hex(' '),
+        romBytes[0xDE192:0xDE1DD],
         # 017E-0180
         # Update jump destination (changed due to removal of some vanilla code).
         "44 3E 01", # 017E: If false, jump to 013E
@@ -10434,7 +10192,7 @@ expandedOffset = scriptHelper(
         "02 04",    # 01CF: Push unsigned byte from $13+04 <-- Item drop's spawn index
         "58 33",    # 01D1: Set bits of object's flags
         # Silently award the boss bounty
-        f"""14 {struct.pack("<H", bossBounties["Jester Spirit"]).hex(' ')}""",
+        f"""14 {uint16.pack(bossBounties["Jester Spirit"]).hex(' ')}""",
                     # 01D3: Push short 0x#### <-- Boss bounty
         "58 98",    # 01D6: Increase nuyen
         # Reveal the Jester Spirit portal
@@ -10483,7 +10241,7 @@ expandedOffset = scriptHelper(
         "58 0E",    # 021A: Set window's text cursor position <-- Repurposed function!
         # Print bounty amount
         "C0",       # 021C: Push zero
-        f"""14 {struct.pack("<H", bossBounties["Jester Spirit"]).hex(' ')}""",
+        f"""14 {uint16.pack(bossBounties["Jester Spirit"]).hex(' ')}""",
                     # 021D: Push short 0x#### <-- Boss bounty
         "02 05",    # 0220: Push unsigned byte from $13+05 <-- Text-window-slot number
         "58 04",    # 0222: Print nuyen amount to window
@@ -10814,7 +10572,7 @@ romBytes[0x6BBC9] |= 0x40
 # - Wait for the portal's 0x01 flag to be set before appearing.
 #   Using the 0x80 flag would be more consistent, but the portal script
 #   is already using that flag as part of player proximity detection.
-writeHelper(romBytes, 0xDE224, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDE224, hexHelper([
     "C2",       # 0009: Push unsigned byte from $13+00 <-- Spawn index
     "58 02",    # 000A: Push object's flags
     "00 01",    # 000C: Push unsigned byte 0x01
@@ -10823,7 +10581,7 @@ writeHelper(romBytes, 0xDE224, bytes.fromhex(' '.join([
     "44 02 00", # 0010: If false, jump to 0002
     "C0",       # 0013: Push zero
     "BC",       # 0014: Pop
-])))
+]))
 # - In vanilla, using the Jester Spirit portal has side effects:
 #    - Partial Bodysuit becomes available at the Dark Blade Gun Shop
 #    - HK 277 A. Rifle becomes available at the Dark Blade Gun Shop
@@ -10831,11 +10589,11 @@ writeHelper(romBytes, 0xDE224, bytes.fromhex(' '.join([
 #    - Some keywords are silently forgotten
 #       - Rust Stilettos, Laughlyn, Nirwanda, Ice, Docks, Bremerton
 # - Skip all of these side effects and just warp to the docks
-writeHelper(romBytes, 0xDE297, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xDE297, hexHelper([
     "00 87",    # 007C: Push unsigned byte 0x87
     "58 56",    # 007E: Teleport to door destination
     "56",       # 0080: End
-])))
+]))
 # TODO:
 # Should the "Vampire respawns after going through the portal" behaviour
 # be reinstated? It happens in vanilla because the portal takes away the
@@ -10847,22 +10605,22 @@ writeHelper(romBytes, 0xDE297, bytes.fromhex(' '.join([
 
 # Computer <-- Drake Towers lobby
 # Remove the check for the Drake Password
-writeHelper(romBytes, 0xFDA77, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xFDA77, hexHelper([
     "BC",       # 0040: Pop
     "C0",       # 0041: Push zero
     "BC",       # 0042: Pop
-])))
+]))
 
 # Elevator Doors helper script
 # - Show the correct floor on the floor indicator in the "game won" case
-writeHelper(romBytes, 0xF76E7, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF76E7, hexHelper([
     "00 20",    # 001A: Push unsigned byte 0x20
     "C2",       # 001C: Push unsigned byte from $13+00 <-- Spawn index
     "58 33",    # 001D: Set bits of object's flags
     "48 24 00", # 001F: Jump to 0024
-])))
+]))
 # - Remove the arrival delay from the Drake Towers / Aneki Building elevators
-writeHelper(romBytes, 0xF771D, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF771D, hexHelper([
     # SET_INDICATOR_FLOOR_NUMBER
     "16 07",    # 0050: Push short from $13+07         <-- Elevator Doors floor number
     "02 01",    # 0052: Push unsigned byte from $13+01 <-- "Event short" index for indicator's floor number
@@ -10926,7 +10684,7 @@ writeHelper(romBytes, 0xF771D, bytes.fromhex(' '.join([
     "44 7D 00", # 0095: If false, jump to TOP_OF_LOOP
     # OPEN_DOORS
     "48 A6 00", # 0098: Jump to 00A6
-])))
+]))
 
 # Elevator Doors that never open
 # Show the correct floor on the floor indicator
@@ -11146,10 +10904,10 @@ expandedOffset = scriptHelper(
 )
 
 # Serpent Scales
-writeHelper(romBytes, 0xD26C3, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xD26C3, hexHelper([
     "B6 01",    # Move the spawn point to match the Gold Naga's spawn point
     "22 11",    # Gold Naga's spawn coordinates: (438, 290, 64)
-])))
+]))
 expandedOffset = scriptHelper(
     scriptNumber = 0x17F,
     argsLen      = 0x02, # Script 0x17F now takes 2 bytes (= 1 stack item) as arguments
@@ -11366,11 +11124,11 @@ expandedOffset = scriptHelper(
 
 # Computer <-- Aneki Building lobby
 # Remove the check for the Aneki Password
-writeHelper(romBytes, 0xFDE62, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xFDE62, hexHelper([
     "BC",       # 0040: Pop
     "C0",       # 0041: Push zero
     "BC",       # 0042: Pop
-])))
+]))
 
 # AI Computer
 expandedOffset = scriptHelper(
@@ -11512,48 +11270,48 @@ for offset in range(0x5EF1, 0x5F15, 2):
 
 # Behaviour script 15C: Random 10/20 nuyen
 # Jump from "display sprite" setup to the pickup code
-writeHelper(romBytes, 0xF96CD, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF96CD, hexHelper([
     "48 1D 00", # 0009: Jump to 001D
-])))
+]))
 
 # Behaviour script 15E: Random 30/40/50/60 nuyen
 # Jump from "display sprite" setup to the pickup code
-writeHelper(romBytes, 0xF972C, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF972C, hexHelper([
     "48 1D 00", # 0009: Jump to 001D
-])))
+]))
 
 # Behaviour script 15F: Random 70/80/90/100 nuyen
 # Jump from "display sprite" setup to the pickup code
-writeHelper(romBytes, 0xF97C7, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF97C7, hexHelper([
     "48 1D 00", # 0009: Jump to 001D
-])))
+]))
 
 # Behaviour script 164: Random 150/170/180/200 nuyen
 # Jump from "display sprite" setup to the pickup code
-writeHelper(romBytes, 0xF9863, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xF9863, hexHelper([
     "48 1D 00", # 0009: Jump to 001D
-])))
+]))
 
 # Behaviour script 247: Spawn random 30/40/50/60 nuyen and fall lower-left to ground
 # Repoint to use script 15E ("Random 30/40/50/60 nuyen") instead
-struct.pack_into(
-    "<H", romBytes, 0x15D18 + (2 * 0x247),
-    struct.unpack_from("<H", romBytes, 0x15D18 + (2 * 0x15E))[0]
+uint16.pack_into(
+    romBytes, 0x15D18 + (2 * 0x247),
+    uint16.unpack_from(romBytes, 0x15D18 + (2 * 0x15E))[0]
 )
 
 # Behaviour script 270: Spawn random 30/40/50/60 nuyen and fall lower-right to ground
 # Repoint to use script 15E ("Random 30/40/50/60 nuyen") instead
-struct.pack_into(
-    "<H", romBytes, 0x15D18 + (2 * 0x270),
-    struct.unpack_from("<H", romBytes, 0x15D18 + (2 * 0x15E))[0]
+uint16.pack_into(
+    romBytes, 0x15D18 + (2 * 0x270),
+    uint16.unpack_from(romBytes, 0x15D18 + (2 * 0x15E))[0]
 )
 
 # ------------------------------------------------------------------------
 
 ## Disable randomly-spawning enemies
-#writeHelper(romBytes, 0xF9B05, bytes.fromhex(' '.join([
+#writeHelper(romBytes, 0xF9B05, hexHelper([
 #    "00 00",    # 001C: Push unsigned byte 0x00
-#])))
+#]))
 
 # ------------------------------------------------------------------------
 
@@ -11584,32 +11342,32 @@ struct.pack_into(
 
 if not args.allow_item_duplication:
     # Behaviour script F9: "Use on" textbox helper script
-    writeHelper(romBytes, 0xDED54, bytes.fromhex(' '.join([
+    writeHelper(romBytes, 0xDED54, hexHelper([
         "C0",       # 000A: Push zero
         "BE",       # 000B: Convert to boolean
         "BE",       # 000C: Convert to boolean
         "BE",       # 000D: Convert to boolean
         "BE",       # 000E: Convert to boolean
         "BC",       # 000F: Pop
-    ])))
+    ]))
     # Behaviour script 23F: "Give to" textbox helper script
-    writeHelper(romBytes, 0xDED76, bytes.fromhex(' '.join([
+    writeHelper(romBytes, 0xDED76, hexHelper([
         "C0",       # 000A: Push zero
         "BE",       # 000B: Convert to boolean
         "BE",       # 000C: Convert to boolean
         "BE",       # 000D: Convert to boolean
         "BE",       # 000E: Convert to boolean
         "BC",       # 000F: Pop
-    ])))
+    ]))
     # Behaviour script 1FB: "Throw at" textbox helper script
-    writeHelper(romBytes, 0xDED98, bytes.fromhex(' '.join([
+    writeHelper(romBytes, 0xDED98, hexHelper([
         "C0",       # 000A: Push zero
         "BE",       # 000B: Convert to boolean
         "BE",       # 000C: Convert to boolean
         "BE",       # 000D: Convert to boolean
         "BE",       # 000E: Convert to boolean
         "BC",       # 000F: Pop
-    ])))
+    ]))
 
 # ------------------------------------------------------------------------
 
@@ -11700,7 +11458,7 @@ writeHelper(romBytes, 0xCBF0, b"".join([
 # gets the pointer to the decker's 7E2E00 data in an inefficient and
 # possibly buggy way, so let's optimize that to free up some space.
 
-writeHelper(romBytes, 0x6327, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x6327, hexHelper([
     "AD FA 1C",    # 00/E327: LDA $1CFA     ; $1CFA = Current music
     "8D E6 1F",    # 00/E32A: STA $1FE6     ; $1FE6 = Backup of current music
     "A5 08",       # 00/E32D: LDA $08       ; $08 = Object-id of decker
@@ -11720,7 +11478,7 @@ writeHelper(romBytes, 0x6327, bytes.fromhex(' '.join([
     "60",          # 00/E349: RTS
     "60",          # 00/E34A: RTS
     "60",          # 00/E34B: RTS           ; Vanilla RTS
-])))
+]))
 
 # ------------------------------------------------------------------------
 
@@ -11765,25 +11523,25 @@ romBytes[0x1CE3] = 0xBD
 ## Start with various equipment
 ## 0x8B2 = Object-id for Jake
 ## Weapons
-#struct.pack_into("<H", initialItemState, 0x2F2C - 0x2E00 + 3, 0x8B2) # Beretta Pistol
-#struct.pack_into("<H", initialItemState, 0x3076 - 0x2E00 + 3, 0x8B2) # Colt L36 Pistol
-#struct.pack_into("<H", initialItemState, 0x3094 - 0x2E00 + 3, 0x8B2) # Fichetti L. Pistol
-#struct.pack_into("<H", initialItemState, 0x380A - 0x2E00 + 3, 0x8B2) # Viper H. Pistol ($3,000)
-#struct.pack_into("<H", initialItemState, 0x307B - 0x2E00 + 3, 0x8B2) # Viper H. Pistol ($4,000)
-#struct.pack_into("<H", initialItemState, 0x3099 - 0x2E00 + 3, 0x8B2) # Warhawk H. Pistol
-#struct.pack_into("<H", initialItemState, 0x380F - 0x2E00 + 3, 0x8B2) # T-250 Shotgun ($12,000)
-#struct.pack_into("<H", initialItemState, 0x3085 - 0x2E00 + 3, 0x8B2) # T-250 Shotgun ($15,000)
-#struct.pack_into("<H", initialItemState, 0x3814 - 0x2E00 + 3, 0x8B2) # Uzi III SMG
-#struct.pack_into("<H", initialItemState, 0x3819 - 0x2E00 + 3, 0x8B2) # HK 277 A. Rifle
-#struct.pack_into("<H", initialItemState, 0x3837 - 0x2E00 + 3, 0x8B2) # AS-7 A. Cannon
+#uint16.pack_into(initialItemState, 0x2F2C - 0x2E00 + 3, 0x8B2) # Beretta Pistol
+#uint16.pack_into(initialItemState, 0x3076 - 0x2E00 + 3, 0x8B2) # Colt L36 Pistol
+#uint16.pack_into(initialItemState, 0x3094 - 0x2E00 + 3, 0x8B2) # Fichetti L. Pistol
+#uint16.pack_into(initialItemState, 0x380A - 0x2E00 + 3, 0x8B2) # Viper H. Pistol ($3,000)
+#uint16.pack_into(initialItemState, 0x307B - 0x2E00 + 3, 0x8B2) # Viper H. Pistol ($4,000)
+#uint16.pack_into(initialItemState, 0x3099 - 0x2E00 + 3, 0x8B2) # Warhawk H. Pistol
+#uint16.pack_into(initialItemState, 0x380F - 0x2E00 + 3, 0x8B2) # T-250 Shotgun ($12,000)
+#uint16.pack_into(initialItemState, 0x3085 - 0x2E00 + 3, 0x8B2) # T-250 Shotgun ($15,000)
+#uint16.pack_into(initialItemState, 0x3814 - 0x2E00 + 3, 0x8B2) # Uzi III SMG
+#uint16.pack_into(initialItemState, 0x3819 - 0x2E00 + 3, 0x8B2) # HK 277 A. Rifle
+#uint16.pack_into(initialItemState, 0x3837 - 0x2E00 + 3, 0x8B2) # AS-7 A. Cannon
 ## Armor
-#struct.pack_into("<H", initialItemState, 0x2F31 - 0x2E00 + 3, 0x8B2) # Leather Jacket
-#struct.pack_into("<H", initialItemState, 0x367A - 0x2E00 + 3, 0x8B2) # Mesh Jacket (free)
-#struct.pack_into("<H", initialItemState, 0x3080 - 0x2E00 + 3, 0x8B2) # Mesh Jacket ($5,000)
-#struct.pack_into("<H", initialItemState, 0x381E - 0x2E00 + 3, 0x8B2) # Bulletproof Vest
-#struct.pack_into("<H", initialItemState, 0x3823 - 0x2E00 + 3, 0x8B2) # Concealed Jacket
-#struct.pack_into("<H", initialItemState, 0x3828 - 0x2E00 + 3, 0x8B2) # Partial Bodysuit
-#struct.pack_into("<H", initialItemState, 0x3832 - 0x2E00 + 3, 0x8B2) # Full Bodysuit
+#uint16.pack_into(initialItemState, 0x2F31 - 0x2E00 + 3, 0x8B2) # Leather Jacket
+#uint16.pack_into(initialItemState, 0x367A - 0x2E00 + 3, 0x8B2) # Mesh Jacket (free)
+#uint16.pack_into(initialItemState, 0x3080 - 0x2E00 + 3, 0x8B2) # Mesh Jacket ($5,000)
+#uint16.pack_into(initialItemState, 0x381E - 0x2E00 + 3, 0x8B2) # Bulletproof Vest
+#uint16.pack_into(initialItemState, 0x3823 - 0x2E00 + 3, 0x8B2) # Concealed Jacket
+#uint16.pack_into(initialItemState, 0x3828 - 0x2E00 + 3, 0x8B2) # Partial Bodysuit
+#uint16.pack_into(initialItemState, 0x3832 - 0x2E00 + 3, 0x8B2) # Full Bodysuit
 
 # ------------------------------------------------------------------------
 
@@ -11791,20 +11549,20 @@ romBytes[0x1CE3] = 0xBD
 #initialItemState[0x59C] |= 0x80
 
 ## Warp to the Gang Leader boss room when exiting the morgue's main room
-#struct.pack_into("<H", romBytes, 0xC84F4, 0xB6) # 0xB6 = Door-id to enter Gang Leader boss room
+#uint16.pack_into(romBytes, 0xC84F4, 0xB6) # 0xB6 = Door-id to enter Gang Leader boss room
 
 ## Set the Jagged Nails entry fee to 0 nuyen (doesn't change text)
 #romBytes[0x179DF] = 0x00
 
 ## Warp to the Octopus boss room when exiting the morgue's main room
-#struct.pack_into("<H", romBytes, 0xC84F4, 0x97) # 0x97 = Door-id to enter Octopus boss room
+#uint16.pack_into(romBytes, 0xC84F4, 0x97) # 0x97 = Door-id to enter Octopus boss room
 
 ## Open the gate to the Rat Shaman Lair
 ## (Side effect: prevents Dog Spirit conversation where you learn "Rat")
 #initialItemState[0x4CA] |= 0x01
 
 ## Warp to the Rat Shaman boss room when exiting the morgue's main room
-#struct.pack_into("<H", romBytes, 0xC84F4, 0x12C) # 0x12C = Door-id to enter Rat Shaman boss room
+#uint16.pack_into(romBytes, 0xC84F4, 0x12C) # 0x12C = Door-id to enter Rat Shaman boss room
 
 ## Allow entry into the Dark Blade mansion
 ## (In vanilla, set the 0x01 flag instead to open the courtyard gate)
@@ -11812,13 +11570,13 @@ romBytes[0x1CE3] = 0xBD
 #initialItemState[0x565] |= 0x02
 
 ## Warp to the Vampire boss room when exiting the morgue's main room
-#struct.pack_into("<H", romBytes, 0xC84F4, 0x13D) # 0x13D = Door-id to enter Vampire boss room
+#uint16.pack_into(romBytes, 0xC84F4, 0x13D) # 0x13D = Door-id to enter Vampire boss room
 
 ## Start with the Strobe
-#struct.pack_into("<H", initialItemState, 0x657, 0x8B2) # 0x8B2 = Object-id for Jake
+#uint16.pack_into(initialItemState, 0x657, 0x8B2) # 0x8B2 = Object-id for Jake
 
 ## Start with the Stake
-#struct.pack_into("<H", initialItemState, 0x2C9, 0x8B2) # 0x8B2 = Object-id for Jake
+#uint16.pack_into(initialItemState, 0x2C9, 0x8B2) # 0x8B2 = Object-id for Jake
 
 ## Make the Massive Orc appear on the Taxiboat Dock
 ## In vanilla, this happens if you know either "Nirwanda" or "Laughlyn"
@@ -11834,34 +11592,34 @@ romBytes[0x1CE3] = 0xBD
 #initialItemState[0x3E9] |= 0x80
 
 ## Start with the Crowbar
-#struct.pack_into("<H", initialItemState, 0x814, 0x8B2) # 0x8B2 = Object-id for Jake
+#uint16.pack_into(initialItemState, 0x814, 0x8B2) # 0x8B2 = Object-id for Jake
 
 ## Open the door leading to Bremerton's interior
 #initialItemState[0x32B] |= 0x01
 
 ## Warp to Safe I's room when exiting the morgue's main room
-#struct.pack_into("<H", romBytes, 0xC84F4, 0x14C) # 0x14C = Door-id to enter Safe I's room
+#uint16.pack_into(romBytes, 0xC84F4, 0x14C) # 0x14C = Door-id to enter Safe I's room
 
 ## Start with the Safe Key
-#struct.pack_into("<H", initialItemState, 0xC47, 0x8B2) # 0x8B2 = Object-id for Jake
+#uint16.pack_into(initialItemState, 0xC47, 0x8B2) # 0x8B2 = Object-id for Jake
 
 ## Warp to Safe II's room when exiting the morgue's main room
-#struct.pack_into("<H", romBytes, 0xC84F4, 0x156) # 0x156 = Door-id to enter Safe II's room
+#uint16.pack_into(romBytes, 0xC84F4, 0x156) # 0x156 = Door-id to enter Safe II's room
 
 ## Start with the Time Bomb
-#struct.pack_into("<H", initialItemState, 0x66B, 0x8B2) # 0x8B2 = Object-id for Jake
+#uint16.pack_into(initialItemState, 0x66B, 0x8B2) # 0x8B2 = Object-id for Jake
 
 ## Start with Safe II's guards defeated
-#struct.pack_into("<H", initialItemState, 0xCA6, 0x1538)
-#struct.pack_into("<H", initialItemState, 0xCAB, 0x1538)
-#struct.pack_into("<H", initialItemState, 0xCB0, 0x1538)
-#struct.pack_into("<H", initialItemState, 0xCB5, 0x1538)
+#uint16.pack_into(initialItemState, 0xCA6, 0x1538)
+#uint16.pack_into(initialItemState, 0xCAB, 0x1538)
+#uint16.pack_into(initialItemState, 0xCB0, 0x1538)
+#uint16.pack_into(initialItemState, 0xCB5, 0x1538)
 
 ## Warp to the Jester Spirit boss room when exiting the morgue's main room
-#struct.pack_into("<H", romBytes, 0xC84F4, 0x4B) # 0x4B = Door-id to enter Jester Spirit boss room
+#uint16.pack_into(romBytes, 0xC84F4, 0x4B) # 0x4B = Door-id to enter Jester Spirit boss room
 
 ## Start with the Cyberdeck
-#struct.pack_into("<H", initialItemState, 0x229, 0x8B2) # 0x8B2 = Object-id for Jake
+#uint16.pack_into(initialItemState, 0x229, 0x8B2) # 0x8B2 = Object-id for Jake
 
 ## In the Computer helper script, skip the "Jake + datajack damaged" check
 #romBytes[0xFD644] = 0x48
@@ -11873,24 +11631,24 @@ romBytes[0x1CE3] = 0xBD
 ## requires you to have the Drake Password in your inventory
 ## in order to proceed.
 ## Examining the Drake Password has no effect.
-#struct.pack_into("<H", initialItemState, 0x81E, 0x8B2) # 0x8B2 = Object-id for Jake
+#uint16.pack_into(initialItemState, 0x81E, 0x8B2) # 0x8B2 = Object-id for Jake
 
 ## Warp to the Gold Naga boss room when exiting the morgue's main room
 ## (For testing the item drop in the Serpent Scales location)
-#struct.pack_into("<H", romBytes, 0xC84F4, 0x9F) # 0x9F = Door-id to enter Gold Naga boss room from lower left
+#uint16.pack_into(romBytes, 0xC84F4, 0x9F) # 0x9F = Door-id to enter Gold Naga boss room from lower left
 
 ## Warp to Professor Pushkin's room when exiting the morgue's main room
-#struct.pack_into("<H", romBytes, 0xC84F4, 0xA2) # 0xA2 = Door-id to enter Professor Pushkin's room
+#uint16.pack_into(romBytes, 0xC84F4, 0xA2) # 0xA2 = Door-id to enter Professor Pushkin's room
 
 ## Start with the Aneki Password
 ## In vanilla, the computer on the first floor of the Aneki Building
 ## requires you to have the Aneki Password in your inventory
 ## in order to proceed.
 ## Examining the Aneki Password has no effect.
-#struct.pack_into("<H", initialItemState, 0x666, 0x8B2) # 0x8B2 = Object-id for Jake
+#uint16.pack_into(initialItemState, 0x666, 0x8B2) # 0x8B2 = Object-id for Jake
 
 ## Warp to the AI Computer room when exiting the morgue's main room
-#struct.pack_into("<H", romBytes, 0xC84F4, 0x176) # 0x176 = Door-id to enter AI Computer room
+#uint16.pack_into(romBytes, 0xC84F4, 0x176) # 0x176 = Door-id to enter AI Computer room
 
 # ------------------------------------------------------------------------
 # TODO:
@@ -11905,7 +11663,7 @@ romBytes[0x1CE3] = 0xBD
 # produce a result larger than the original compressed data. So instead,
 # let's write the uncompressed modified data to 0x108000, and update the
 # ROM to use that instead.
-writeHelper(romBytes, 0x186C, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x186C, hexHelper([
     "A2 3E 00",    # 00/986C: LDX #$003E
     "A9 00 00",    # 00/986F: LDA #$0000
     "9F BB 3B 7E", # 00/9872: STA $7E3BBB,X
@@ -11917,48 +11675,48 @@ writeHelper(romBytes, 0x186C, bytes.fromhex(' '.join([
     "A0 00 2E",    # 00/987E: LDY #$2E00
     "A9 BA 0D",    # 00/9881: LDA #$0DBA
     "54 7E A1",    # 00/9884: MVN $A1,$7E   ; Copy from 0x108000 to $7E2E00
-])))
+]))
 writeHelper(romBytes, 0x108000, initialItemState)
 
 
 
 # Add the randomizer version, seed and flags to the title screen
 # Update the main menu
-writeHelper(romBytes, 0xE34E, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xE34E, hexHelper([
     "22 00 90 A1", # 01/E34E: JSL $A19000   ; New printing subroutine
     "4B",          # 01/E352: PHK
     "AB",          # 01/E353: PLB
-])))
+]))
 # Move the menu options down one row
-struct.pack_into("<H", romBytes, 0xE355, 0x0454) # "START NEW GAME"
-struct.pack_into("<H", romBytes, 0xE35F, 0x04D4) # "START SAVED GAME"
-struct.pack_into("<H", romBytes, 0xE369, 0x0554) # "OPTIONS"
+uint16.pack_into(romBytes, 0xE355, 0x0454) # "START NEW GAME"
+uint16.pack_into(romBytes, 0xE35F, 0x04D4) # "START SAVED GAME"
+uint16.pack_into(romBytes, 0xE369, 0x0554) # "OPTIONS"
 
 # Update the "START SAVED GAME" menu
-writeHelper(romBytes, 0xE39B, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xE39B, hexHelper([
     "22 00 90 A1", # 01/E39B: JSL $A19000   ; New printing subroutine
     "4B",          # 01/E39F: PHK
     "AB",          # 01/E3A0: PLB
-])))
+]))
 # Move the menu options down one row
-struct.pack_into("<H", romBytes, 0xE3C1, 0x0454) # "RESUME GAME 1"
-struct.pack_into("<H", romBytes, 0xE3D0, 0x04D4) # "RESUME GAME 2"
-struct.pack_into("<H", romBytes, 0xE3DC, 0x0554) # "EXIT"
+uint16.pack_into(romBytes, 0xE3C1, 0x0454) # "RESUME GAME 1"
+uint16.pack_into(romBytes, 0xE3D0, 0x04D4) # "RESUME GAME 2"
+uint16.pack_into(romBytes, 0xE3DC, 0x0554) # "EXIT"
 
 # Update the "OPTIONS" menu
-writeHelper(romBytes, 0xE407, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0xE407, hexHelper([
     "22 00 90 A1", # 01/E407: JSL $A19000   ; New printing subroutine
     "4B",          # 01/E40B: PHK
     "AB",          # 01/E40C: PLB
-])))
+]))
 # Move the menu options down one row
-struct.pack_into("<H", romBytes, 0xE424, 0x0454) # "CONTROL TYPE (B|A)"
-struct.pack_into("<H", romBytes, 0xE40E, 0x04D4) # "(STEREO|MONO)PHONIC"
-struct.pack_into("<H", romBytes, 0xE43A, 0x0554) # "B.G. MUSIC (FULL|EVENT|OFF)"
-struct.pack_into("<H", romBytes, 0xE458, 0x05D4) # "EXIT"
+uint16.pack_into(romBytes, 0xE424, 0x0454) # "CONTROL TYPE (B|A)"
+uint16.pack_into(romBytes, 0xE40E, 0x04D4) # "(STEREO|MONO)PHONIC"
+uint16.pack_into(romBytes, 0xE43A, 0x0554) # "B.G. MUSIC (FULL|EVENT|OFF)"
+uint16.pack_into(romBytes, 0xE458, 0x05D4) # "EXIT"
 
 # Move the menu cursor down one row
-struct.pack_into("<H", romBytes, 0xE2F7, 0x0450)
+uint16.pack_into(romBytes, 0xE2F7, 0x0450)
 
 # Construct the new info lines
 newInfoLines = (
@@ -11967,7 +11725,7 @@ newInfoLines = (
 ).encode("ascii") + b"\x00"
 
 # New printing subroutine
-writeHelper(romBytes, 0x109000, bytes.fromhex(' '.join([
+writeHelper(romBytes, 0x109000, hexHelper([
     "22 12 D5 81", # A0/9000: JSL $81D512   ; Print the copyright line
     "4B",          # A0/9004: PHK
     "AB",          # A0/9005: PLB
@@ -11975,7 +11733,7 @@ writeHelper(romBytes, 0x109000, bytes.fromhex(' '.join([
     "A0 20 90",    # A0/9009: LDY #$9020    ; Source address for text
     "22 EE D4 81", # A0/900C: JSL $81D4EE   ; Print the new info lines
     "6B",          # A0/9010: RTL
-])))
+]))
 writeHelper(romBytes, 0x109020, newInfoLines)
 
 
@@ -11993,7 +11751,7 @@ romBytes[0x23DE] = 0xA2
 # - Item shuffled to the new "Nuyen: Rat Shaman" location
 romBytes[0x114600]          = romBytes[0xD0636]            # Vanilla drawing data
 romBytes[0x114601]          = romBytes[0xD0637]            # Vanilla music
-romBytes[0x114602:0x114604] = struct.pack("<H", 0xC6AE)    # Vanilla camera pointer, adjusted for the new room data location
+romBytes[0x114602:0x114604] = uint16.pack(0xC6AE)          # Vanilla camera pointer, adjusted for the new room data location
 romBytes[0x114604]          = romBytes[0xD063A] + 2        # +2 to the number of objects
 romBytes[0x114605:0x114629] = romBytes[0xD063B:0xD065F]    # Vanilla objects
 romBytes[0x114629:0x11462D] = bytes.fromhex("88 01 C8 19") # Randomized object's coordinates (near the Rat Shaman)
@@ -12004,7 +11762,7 @@ romBytes[0x114635:0x11465C] = romBytes[0xD065F:0xD0686]    # Vanilla remainder o
 romBytes[0x11465C:0x11465E] = bytes.fromhex("60 02")       # Enlarge the entrance's warp zone to make it easier to traverse
 romBytes[0x11465E:0x1146B0] = romBytes[0xD0688:0xD06DA]    # Vanilla remainder of room data, part 2
 # Update the door destinations to lead to the new Rat Shaman boss room
-struct.pack_into("<H", romBytes, 0x692AF + (9 * 0x12C), 0x4600)
+uint16.pack_into(romBytes, 0x692AF + (9 * 0x12C), 0x4600)
 
 # Make a new version of the Vampire boss room at 0x114700.
 # This version has two randomized objects:
@@ -12012,7 +11770,7 @@ struct.pack_into("<H", romBytes, 0x692AF + (9 * 0x12C), 0x4600)
 # - Item shuffled to the new "Nuyen: Vampire" location
 romBytes[0x114700]          = romBytes[0xD0F4A]            # Vanilla drawing data
 romBytes[0x114701]          = romBytes[0xD0F4B]            # Vanilla music
-romBytes[0x114702:0x114704] = struct.pack("<H", 0xC796)    # Vanilla camera pointer, adjusted for the new room data location
+romBytes[0x114702:0x114704] = uint16.pack(0xC796)          # Vanilla camera pointer, adjusted for the new room data location
 romBytes[0x114704]          = romBytes[0xD0F4E] + 2        # +2 to the number of objects
 romBytes[0x114705:0x114723] = romBytes[0xD0F4F:0xD0F6D]    # Vanilla objects
 romBytes[0x114723:0x114727] = bytes.fromhex("C8 01 80 11") # Randomized object's coordinates (near the entrance stairs)
@@ -12021,7 +11779,7 @@ romBytes[0x114729:0x11472D] = bytes.fromhex("C8 01 A0 11") # Randomized object's
 romBytes[0x11472D:0x11472F] = romBytes[0xD29AD:0xD29AF]    # Randomized object's object-id
 romBytes[0x11472F:0x1147A0] = romBytes[0xD0F6D:0xD0FDE]    # Vanilla remainder of room data
 # Update the door destinations to lead to the new Vampire boss room
-struct.pack_into("<H", romBytes, 0x692AF + (9 * 0x13D), 0x4700)
+uint16.pack_into(romBytes, 0x692AF + (9 * 0x13D), 0x4700)
 
 # Make a new version of the Jester Spirit boss room at 0x114800.
 # This version has two randomized objects:
@@ -12029,7 +11787,7 @@ struct.pack_into("<H", romBytes, 0x692AF + (9 * 0x13D), 0x4700)
 # - Item shuffled to the existing "Jester Spirit Insignia" location
 romBytes[0x114800]          = romBytes[0xCAE08]            # Vanilla drawing data
 romBytes[0x114801]          = romBytes[0xCAE09]            # Vanilla music
-romBytes[0x114802:0x114804] = struct.pack("<H", 0xC946)    # Vanilla camera pointer, adjusted for the new room data location
+romBytes[0x114802:0x114804] = uint16.pack(0xC946)          # Vanilla camera pointer, adjusted for the new room data location
 romBytes[0x114804]          = romBytes[0xCAE0C] + 1        # +1 to the number of objects
 romBytes[0x114805:0x114817] = romBytes[0xCAE0D:0xCAE1F]    # Vanilla objects
 romBytes[0x114817:0x11481B] = bytes.fromhex("B0 01 3D 12") # Randomized object's coordinates (near the exit portal)
@@ -12039,7 +11797,7 @@ romBytes[0x114823:0x114827] = bytes.fromhex("90 01 3D 12") # Randomized object's
 romBytes[0x114827:0x114829] = romBytes[0xCAE23:0xCAE25]    # Randomized object's object-id
 romBytes[0x114829:0x114948] = romBytes[0xCAE2B:0xCAF4A]    # Vanilla remainder of room data
 # Update the door destinations to lead to the new Jester Spirit boss room
-struct.pack_into("<H", romBytes, 0x692AF + (9 * 0x4B), 0x4800)
+uint16.pack_into(romBytes, 0x692AF + (9 * 0x4B), 0x4800)
 
 
 